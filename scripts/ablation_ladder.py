@@ -15,8 +15,11 @@ import os
 sys.path.append('../simulations')
 from quaternion_simulator import QuaternionFieldSimulator
 
-OUTPUT_DIR = '/home/ubuntu/REN-01/validation/output'
-FIG_DIR = '/home/ubuntu/REN-01/validation/figures'
+# Output directories (shared with regime_uniqueness_tests.py; build_figures.py
+# reads ablation_data.pkl from here)
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+OUTPUT_DIR = os.path.join(REPO_DIR, 'validation', 'output')
+FIG_DIR = os.path.join(REPO_DIR, 'validation', 'figures')
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(FIG_DIR, exist_ok=True)
@@ -111,7 +114,9 @@ def run_ablation_suite():
         sim.set_parameters(**params)
         sim.initialize('degenerative', seed=42)
         
-        history = sim.run(save_interval=10, verbose=False)
+        # Only the final fields are read; chi is kept in full
+        history = sim.run(save_interval=10, verbose=False,
+                          record={'psi_D', 'phi_E'}, window=1)
         
         chi_final = history['chi'][-1]
         chi_mean = np.mean(history['chi'][-10:])
@@ -0,0 +1,273 @@
+"""
+REN-01 Batched Quaternion Field Simulator
+Advances an ensemble of independent quaternion fields in one vectorized step.
+
+The field stack has shape (B, 4, Nx, Ny): axis 0 indexes ensemble members,
+axis 1 the quaternion components q0..q3. Every evolution parameter may be a
+scalar shared by the whole ensemble or a length-B vector with one value per
+member; vectors are stored with shape (B, 1, 1) so that they broadcast against
+single components Q[:, i] of shape (B, Nx, Ny).
+
+Each member follows exactly the same semi-implicit Euler scheme as
+QuaternionFieldSimulator.step(), so a batched run reproduces B separate runs
+while paying the Python per-step overhead only once.
+"""
+
+import numpy as np
+
+from quaternion_simulator import (PARAMETER_NAMES, History, PeriodicLaplacian,
+                                  scenario_initial_field)
+
+
+class BatchedQuaternionSimulator:
+    """Vectorized ensemble of REN-01 quaternion field simulations."""
+    
+    def __init__(self, batch_size, Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0,
+                 homogeneous=None):
+        """
+        Initialize batched simulator.
+        
+        Parameters:
+            batch_size: Number of ensemble members B
+            Lx, Ly: Domain size
+            dx: Grid spacing
+            dt: Time step
+            T: Total simulation time
+            homogeneous: As for QuaternionFieldSimulator; when every member
+                         is spatially uniform (e.g. broadcast S³ samples),
+                         run() integrates the (B, 4, 1, 1) reduced system
+        """
+        self.B = int(batch_size)
+        self.Lx, self.Ly = Lx, Ly
+        self.dx, self.dt, self.T = dx, dt, T
+        self.Nx, self.Ny = int(Lx/dx), int(Ly/dx)
+        self.Nt = int(T/dt)
+        self.homogeneous = homogeneous
+        
+        # Time at which run(stop_when_steady=True) stopped (None: ran to T)
+        self.stop_time = None
+        
+        # Quaternion field stack: Q[b] = q0 + q1*i + q2*j + q3*k
+        self.Q = np.zeros((self.B, 4, self.Nx, self.Ny))
+        
+        # Fused stencil over the whole stack (halo buffers allocated once)
+        self._stencil = PeriodicLaplacian(self.Q.shape, self.dx)
+        
+        # History storage (per-member scalars only; full fields of B members
+        # would cost B times the memory of a single run)
+        self.history = History()
+    
+    def set_parameters(self, D_Q, alpha_D, alpha_A, beta_E,
+                       gamma_0, gamma_1, gamma_2, gamma_3):
+        """
+        Set evolution parameters.
+        
+        Each parameter is either a scalar applied to every member or a
+        sequence of length B giving one value per member.
+        """
+        values = (D_Q, alpha_D, alpha_A, beta_E,
+                  gamma_0, gamma_1, gamma_2, gamma_3)
+        for name, value in zip(PARAMETER_NAMES, values):
+            value = np.asarray(value, dtype=float)
+            if value.ndim == 0:
+                value = np.full(self.B, float(value))
+            if value.shape != (self.B,):
+                raise ValueError(f"{name} must be a scalar or have shape ({self.B},), "
+                                 f"got {value.shape}")
+            setattr(self, name, value.reshape(self.B, 1, 1))
+    
+    def initialize(self, scenario='healthy', seeds=42):
+        """
+        Initialize every member from a scenario, as QuaternionFieldSimulator.initialize().
+        
+        Parameters:
+            scenario: Scenario name, or a sequence of B scenario names
+            seeds: Random seed, or a sequence of B per-member seeds
+        """
+        scenarios = [scenario] * self.B if isinstance(scenario, str) else list(scenario)
+        seeds = [seeds] * self.B if np.ndim(seeds) == 0 else list(seeds)
+        if len(scenarios) != self.B or len(seeds) != self.B:
+            raise ValueError(f"Expected {self.B} scenarios and seeds")
+        
+        for b in range(self.B):
+            scenario_initial_field(self.Q[b], scenarios[b], seeds[b])
+    
+    def set_uniform_state(self, q):
+        """
+        Broadcast quaternions to the whole spatial grid.
+        
+        Parameters:
+            q: Array of shape (4,) shared by all members, or (B, 4) per member
+        """
+        q = np.broadcast_to(np.asarray(q, dtype=float), (self.B, 4))
+        self.Q[...] = q[:, :, np.newaxis, np.newaxis]
+    
+    def compute_phi_E(self):
+        """Compute local entropy density per member: phi_E = q1^2 + q2^2 + q3^2"""
+        return self.Q[:, 1]**2 + self.Q[:, 2]**2 + self.Q[:, 3]**2
+    
+    def compute_psi_D(self):
+        """Compute dopaminergic density per member: psi_D = q0^2"""
+        return self.Q[:, 0]**2
+    
+    def compute_A(self):
+        """Compute astrocytic projection per member: A = q2^2"""
+        return self.Q[:, 2]**2
+    
+    def compute_chi(self):
+        """
+        Compute the collapse metric of every member.
+        
+        Returns:
+            chi: Array of shape (B,)
+        """
+        phi_E = self.compute_phi_E()
+        
+        q0_norm_sq = np.sum(self.Q[:, 0]**2, axis=(1, 2)) * self.cell_area
+        q2_norm_sq = np.sum(self.Q[:, 2]**2, axis=(1, 2)) * self.cell_area
+        phi_E_integral = np.sum(phi_E, axis=(1, 2)) * self.cell_area
+        
+        alpha_D = self.alpha_D[:, 0, 0]
+        alpha_A = self.alpha_A[:, 0, 0]
+        beta_E = self.beta_E[:, 0, 0]
+        numerator = (alpha_D * q0_norm_sq +
+                     alpha_A * q2_norm_sq +
+                     beta_E * phi_E_integral)
+        
+        grad_Q_sq = np.zeros(self.B)
+        for i in range(4 if self.Q.shape[-2:] != (1, 1) else 0):
+            grad_x = np.gradient(self.Q[:, i], axis=1) / self.dx
+            grad_y = np.gradient(self.Q[:, i], axis=2) / self.dx
+            grad_Q_sq += np.sum(grad_x**2 + grad_y**2, axis=(1, 2)) * self.dx**2
+        
+        denominator = grad_Q_sq + self.gamma_0[:, 0, 0]
+        
+        chi = np.zeros(self.B)
+        np.divide(numerator, denominator, out=chi, where=denominator > 0)
+        return chi
+    
+    def compute_q_norms(self):
+        """Compute L2 norms of the four components per member, shape (B, 4)."""
+        return np.sqrt(np.sum(self.Q**2, axis=(2, 3)) * self.cell_area)
+    
+    @property
+    def cell_area(self):
+        """Integration weight of one stored cell (the whole grid for a reduced uniform state)."""
+        return self.dx**2 * (self.Nx * self.Ny) / self.Q[0, 0].size
+    
+    def laplacian(self, field):
+        """Compute the periodic Laplacian over the last two axes with the fused stencil."""
+        if self._stencil.shape != field.shape or self._stencil.padded.dtype != field.dtype:
+            self._stencil = PeriodicLaplacian(field.shape, self.dx, dtype=field.dtype)
+        return self._stencil(field)
+    
+    def nonlinear_forcing(self, Q):
+        """
+        Compute nonlinear forcing term for every member.
+        N(Q) = alpha_D*i*Q + alpha_A*j*Q - beta_E*phi_E*i*Q
+        """
+        q0, q1, q2, q3 = Q[:, 0], Q[:, 1], Q[:, 2], Q[:, 3]
+        phi_E = q1**2 + q2**2 + q3**2
+        
+        N = np.zeros_like(Q)
+        
+        # alpha_D * i*Q = alpha_D * (-q1 + q0*i - q3*j + q2*k)
+        N[:, 0] -= self.alpha_D * q1
+        N[:, 1] += self.alpha_D * q0
+        N[:, 2] -= self.alpha_D * q3
+        N[:, 3] += self.alpha_D * q2
+        
+        # alpha_A * j*Q = alpha_A * (-q2 + q3*i + q0*j - q1*k)
+        N[:, 0] -= self.alpha_A * q2
+        N[:, 1] += self.alpha_A * q3
+        N[:, 2] += self.alpha_A * q0
+        N[:, 3] -= self.alpha_A * q1
+        
+        # -beta_E * phi_E * i*Q
+        N[:, 0] += self.beta_E * phi_E * q1
+        N[:, 1] -= self.beta_E * phi_E * q0
+        N[:, 2] += self.beta_E * phi_E * q3
+        N[:, 3] -= self.beta_E * phi_E * q2
+        
+        return N
+    
+    def step(self):
+        """Perform one semi-implicit Euler step for the whole ensemble."""
+        N = self.nonlinear_forcing(self.Q)
+        
+        # Per-member coefficients broadcast over the component axis
+        diffusion = (self.dt * self.D_Q)[:, np.newaxis]
+        decay = (1 + self.dt * self.gamma_0)[:, np.newaxis]
+        
+        rhs = self.Q + self.dt * N
+        lap = self.laplacian(self.Q)
+        self.Q = (rhs + diffusion * lap) / decay
+    
+    def run(self, save_interval=20, verbose=True, stop_when_steady=False,
+            tol=1e-6, chi_tol=None):
+        """
+        Run all ensemble members.
+        
+        Parameters:
+            save_interval: Save observables every N steps
+            verbose: Print progress
+            stop_when_steady: Stop once every member is stationary, as for
+                              QuaternionFieldSimulator.run()
+            tol: Stationarity tolerance on ||Q^{n+1} - Q^n||_rms / dt
+            chi_tol: Tolerance on the change of chi between save points
+                     (default: tol)
+        
+        Returns:
+            history: History with 'time' (Nsave,), 'chi' (Nsave, B) and
+                     'q_norms' (Nsave, B, 4)
+        """
+        n_saves = len(range(0, self.Nt, save_interval))
+        self.history.reserve('time', n_saves)
+        self.history.reserve('chi', n_saves, (self.B,))
+        self.history.reserve('q_norms', n_saves, (self.B, 4))
+        
+        reduced = self.homogeneous is not False and self.Q.shape[-2:] != (1, 1) and (
+            self.homogeneous or np.all(self.Q == self.Q[..., :1, :1]))
+        if reduced:
+            self.Q = self.Q[..., :1, :1].copy()
+        
+        try:
+            self._run_steps(save_interval, verbose, stop_when_steady,
+                            tol, tol if chi_tol is None else chi_tol)
+        finally:
+            if reduced:
+                self.Q = np.ascontiguousarray(
+                    np.broadcast_to(self.Q, (self.B, 4, self.Nx, self.Ny)))
+        
+        return self.history
+    
+    def _run_steps(self, save_interval, verbose, stop_when_steady=False,
+                   tol=1e-6, chi_tol=1e-6):
+        """Fixed-step loop over Nt steps, saving every save_interval steps."""
+        self.stop_time = None
+        for n in range(self.Nt):
+            if stop_when_steady and n % save_interval == 0:
+                Q_prev = self.Q.copy()
+            self.step()
+            
+            if n % save_interval == 0:
+                t = n * self.dt
+                self.history.append('time', t)
+                self.history.append('chi', self.compute_chi())
+                self.history.append('q_norms', self.compute_q_norms())
+                
+                if verbose and n % 200 == 0:
+                    chi = self.history['chi'][-1]
+                    print(f"Step {n}/{self.Nt}, t={t:.2f}, "
+                          f"chi={np.mean(chi):.4f} ± {np.std(chi):.4f} (B={self.B})")
+                
+                if stop_when_steady and n > 0:
+                    rate = np.sqrt(np.mean((self.Q - Q_prev)**2, axis=(1, 2, 3))) / self.dt
+                    chi_change = np.abs(self.history['chi'][-1] - self.history['chi'][-2])
+                    if np.all(rate <= tol) and np.all(chi_change <= chi_tol):
+                        self.stop_time = t
+                        for m in range(n + save_interval, self.Nt, save_interval):
+                            self.history.append('time', m * self.dt)
+                            self.history.append('chi', self.history['chi'][-1])
+                            self.history.append('q_norms', self.history['q_norms'][-1])
+                        return
@@ -0,0 +1,293 @@
+"""
+REN-01 Figure Build
+Incremental, parallel rendering of the manuscript figures.
+
+Every target lists the PNGs it writes under figures/, the function that
+renders them and the inputs they depend on:
+
+    artifacts:<set>   scenario artifacts of a parameter set (see
+                      scenario_artifacts.py), identified by the result-cache
+                      keys of their runs
+    <path>            a file relative to the repository root, e.g.
+                      data/empirical_parameters.json or a validation pickle
+
+The generating module's source is an input as well. A hash of all inputs
+is stored per target in simulations/figure_manifest.json; a target is
+rebuilt only when that hash changes or one of its outputs is missing.
+Targets whose input files do not exist are skipped. The validation
+pickles are written to validation/output/ (OUTPUT_DIR of their producers):
+r2_basin_data.pkl by regime_uniqueness_tests.py (R2) and ablation_data.pkl
+by ablation_ladder.py.
+
+Not every PNG under figures/ is a target. ablation_ladder.png is the
+summary plot ablation_ladder.py saves to validation/figures/ as a side
+effect of its simulations, and regenerate_all_figures.py is a standalone
+renderer whose fig5b_r2_overlaid_histograms.png and fig5c_r2_boxplots.png
+variants plot synthetic distributions rather than validation data. Neither
+is rebuilt here.
+
+Stale targets are rendered concurrently in a process pool with the Agg
+backend. Scenario artifacts are built in the parent process first, so no
+simulation runs twice.
+
+Usage:
+    python build_figures.py               rebuild stale figures
+    python build_figures.py fig3 fig4     rebuild only these targets (if stale)
+    python build_figures.py --force       rebuild everything
+    python build_figures.py --dry-run     list stale targets
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(SCRIPTS_DIR)
+MANIFEST = os.path.join(REPO_DIR, 'simulations', 'figure_manifest.json')
+
+EMPIRICAL = 'data/empirical_parameters.json'
+# OUTPUT_DIR of regime_uniqueness_tests.py and ablation_ladder.py
+VALIDATION_OUTPUT = 'validation/output'
+R2_DATA = f'{VALIDATION_OUTPUT}/r2_basin_data.pkl'
+ABLATION_DATA = f'{VALIDATION_OUTPUT}/ablation_data.pkl'
+
+
+class Target:
+    """One rendering step: a function writing one or more figures."""
+    
+    def __init__(self, name, outputs, module, function, args=(), inputs=()):
+        """
+        Parameters:
+            name: Target name used on the command line
+            outputs: Figure filenames written under figures/
+            module, function: Generating function (module in scripts/)
+            args: Positional arguments of the function
+            inputs: Artifact sets ('artifacts:<set>') and repository files
+        """
+        self.name = name
+        self.outputs = tuple(outputs)
+        self.module = module
+        self.function = function
+        self.args = tuple(args)
+        self.inputs = tuple(inputs)
+
+
+TARGETS = [
+    Target('fig1a', ['fig1a_healthy_quaternion_components.png'],
+           'generate_fig1_separate', 'generate_scenario_figure',
+           ('healthy', 'Healthy', 'green', '1a'), ['artifacts:empirical', EMPIRICAL]),
+    Target('fig1b', ['fig1b_degenerative_quaternion_components.png'],
+           'generate_fig1_separate', 'generate_scenario_figure',
+           ('degenerative', 'Degenerative', 'red', '1b'), ['artifacts:empirical', EMPIRICAL]),
+    Target('fig1c', ['fig1c_ren01_quaternion_components.png'],
+           'generate_fig1_separate', 'generate_scenario_figure',
+           ('ren01', 'REN-01', 'blue', '1c'), ['artifacts:empirical', EMPIRICAL]),
+    Target('fig2', ['fig2_algebraic_chain_trajectories.png'],
+           'generate_fig2_trajectories', 'generate_fig2_trajectories',
+           inputs=['artifacts:empirical', EMPIRICAL]),
+    Target('fig3', ['fig3_coherence_order_parameter.png'],
+           'generate_fig3_coherence', 'generate_fig3_coherence',
+           inputs=['artifacts:empirical', EMPIRICAL]),
+    Target('fig4', ['fig4_entropy_dopamine_fields.png'],
+           'generate_fig4_fields', 'generate_fig4_fields',
+           inputs=['artifacts:empirical', EMPIRICAL]),
+    Target('fig5a', ['fig5a_r1_attractor_topology.png'],
+           'regenerate_fig5a', 'generate_fig5a_custom',
+           inputs=['artifacts:empirical', EMPIRICAL]),
+    Target('fig5b', ['fig5b_r2_basin_scatter.png'],
+           'split_fig5b', 'generate_fig5b_basin', inputs=[R2_DATA]),
+    Target('fig5c', ['fig5c_r2_distributions.png'],
+           'split_fig5b', 'generate_fig5c_distributions', inputs=[R2_DATA]),
+    Target('fig5d', ['fig5d_ablation_ordering.png'],
+           'split_ablation_figs', 'generate_fig5d', inputs=[ABLATION_DATA]),
+    Target('fig5e', ['fig5e_ablation_fields.png'],
+           'split_ablation_figs', 'generate_fig5e', inputs=[ABLATION_DATA]),
+    Target('fig5f', ['fig5f_ablation_summary.png'],
+           'split_ablation_figs', 'generate_fig5f', inputs=[ABLATION_DATA]),
+    Target('schematic', ['system_schematic.png'],
+           'generate_schematic', 'generate_schematic'),
+]
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(2**20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def artifact_hash(parameter_set):
+    """Identity of a set of scenario artifacts, building them if needed."""
+    from scenario_artifacts import load_artifacts
+    artifacts = load_artifacts(parameter_set)
+    keys = [artifacts[scenario].key for scenario in sorted(artifacts)]
+    keys.append(file_hash(os.path.join(SCRIPTS_DIR, 'scenario_artifacts.py')))
+    return hashlib.sha256(' '.join(keys).encode()).hexdigest()
+
+
+def input_hashes(target, artifact_hashes):
+    """
+    Hashes of a target's inputs and code.
+    
+    Returns:
+        (hashes, missing): dictionary input -> hash, and the input files
+        that do not exist
+    """
+    hashes = {'code': file_hash(os.path.join(SCRIPTS_DIR, f'{target.module}.py')),
+              'args': repr(target.args)}
+    missing = []
+    for name in target.inputs:
+        if name.startswith('artifacts:'):
+            hashes[name] = artifact_hashes[name.split(':', 1)[1]]
+        elif os.path.exists(os.path.join(REPO_DIR, name)):
+            hashes[name] = file_hash(os.path.join(REPO_DIR, name))
+        else:
+            missing.append(name)
+    return hashes, missing
+
+
+def signature(hashes):
+    return hashlib.sha256(json.dumps(hashes, sort_keys=True).encode()).hexdigest()
+
+
+def load_manifest():
+    if not os.path.exists(MANIFEST):
+        return {}
+    with open(MANIFEST, 'r') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest):
+    """Write the manifest atomically."""
+    os.makedirs(os.path.dirname(MANIFEST), exist_ok=True)
+    tmp_path = MANIFEST + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST)
+
+
+def _init_worker():
+    """Render off-screen and resolve the scripts' relative paths from scripts/."""
+    import matplotlib
+    matplotlib.use('Agg')
+    os.chdir(SCRIPTS_DIR)
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+
+
+def _render(module, function, args):
+    """Run one target's generating function (in a worker process)."""
+    start = time.perf_counter()
+    getattr(importlib.import_module(module), function)(*args)
+    return time.perf_counter() - start
+
+
+def build(names=None, jobs=None, force=False, dry_run=False, verbose=True):
+    """
+    Rebuild the stale figure targets.
+    
+    Parameters:
+        names: Target names to consider (default: all)
+        jobs: Worker processes (default: os.cpu_count())
+        force: Rebuild regardless of the manifest
+        dry_run: Only report what would be rebuilt
+        verbose: Print progress
+    
+    Returns:
+        Dictionary target name -> 'built', 'up to date', 'skipped',
+        'stale' (dry run) or 'failed'
+    """
+    targets = TARGETS if not names else [target for target in TARGETS if target.name in names]
+    unknown = set(names or ()) - {target.name for target in TARGETS}
+    if unknown:
+        raise ValueError(f"Unknown targets {sorted(unknown)}, "
+                         f"expected from {[target.name for target in TARGETS]}")
+    
+    # Artifacts are built here once, before any worker needs them
+    artifact_sets = sorted({name.split(':', 1)[1] for target in targets
+                            for name in target.inputs if name.startswith('artifacts:')})
+    artifact_hashes = {parameter_set: artifact_hash(parameter_set)
+                       for parameter_set in artifact_sets}
+    
+    manifest = load_manifest()
+    status, stale = {}, []
+    for target in targets:
+        hashes, missing = input_hashes(target, artifact_hashes)
+        if missing:
+            status[target.name] = 'skipped'
+            if verbose:
+                print(f"{target.name}: skipped, missing {', '.join(missing)}")
+            continue
+        outputs_exist = all(os.path.exists(os.path.join(REPO_DIR, 'figures', output))
+                            for output in target.outputs)
+        if not force and outputs_exist and manifest.get(target.name) == signature(hashes):
+            status[target.name] = 'up to date'
+            continue
+        stale.append((target, signature(hashes)))
+    
+    if dry_run or not stale:
+        for target, _ in stale:
+            status[target.name] = 'stale'
+            if verbose:
+                print(f"{target.name}: stale ({', '.join(target.outputs)})")
+        return status
+    
+    os.makedirs(os.path.join(REPO_DIR, 'figures'), exist_ok=True)
+    os.environ['MPLBACKEND'] = 'Agg'
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        futures = {pool.submit(_render, target.module, target.function, target.args):
+                   (target, target_signature) for target, target_signature in stale}
+        for future in as_completed(futures):
+            target, target_signature = futures[future]
+            try:
+                elapsed = future.result()
+            except Exception as error:
+                status[target.name] = 'failed'
+                manifest.pop(target.name, None)
+                if verbose:
+                    print(f"{target.name}: FAILED ({type(error).__name__}: {error})")
+                continue
+            status[target.name] = 'built'
+            manifest[target.name] = target_signature
+            if verbose:
+                print(f"{target.name}: built in {elapsed:.1f}s")
+    
+    save_manifest(manifest)
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the REN-01 figures whose inputs changed.")
+    parser.add_argument('targets', nargs='*', help="Targets to consider (default: all)")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="Worker processes (default: number of CPUs)")
+    parser.add_argument('--force', action='store_true', help="Rebuild regardless of the manifest")
+    parser.add_argument('--dry-run', action='store_true', help="Only list stale targets")
+    parser.add_argument('--list', action='store_true', help="List targets and their inputs")
+    args = parser.parse_args(argv)
+    
+    if args.list:
+        for target in TARGETS:
+            print(f"{target.name:10s} {', '.join(target.outputs)}")
+            print(f"{'':10s}   <- {target.module}.py {' '.join(target.inputs)}")
+        return 0
+    
+    start = time.perf_counter()
+    status = build(args.targets, args.jobs, args.force, args.dry_run)
+    counts = {}
+    for value in status.values():
+        counts[value] = counts.get(value, 0) + 1
+    print(', '.join(f"{count} {value}" for value, count in sorted(counts.items()))
+          + f" ({time.perf_counter() - start:.1f}s)")
+    return 1 if 'failed' in counts else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
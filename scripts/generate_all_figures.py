@@ -4,21 +4,12 @@ Generate All Manuscript Figures with Empirical Parameters
 
 import numpy as np
 import matplotlib.pyplot as plt
-import json
 import sys
 sys.path.append('.')
-from quaternion_simulator import QuaternionFieldSimulator
-
-# Load empirical parameters
-with open('../data/empirical_parameters.json', 'r') as f:
-    emp_params = json.load(f)
+from scenario_artifacts import load_artifacts
 
 FIGURE_DIR = '../figures'
 
-def get_scenario_params(scenario):
-    """Get parameters for scenario"""
-    return emp_params['simulation_parameters'][scenario]
-
 # Figure 1: Quaternion Components Evolution
 def generate_fig1_quaternion_components():
     """Generate quaternion component evolution for all scenarios"""
@@ -30,26 +21,15 @@ def generate_fig1_quaternion_components():
     colors = ['green', 'red', 'blue']
     
     for row, (scenario, label, color) in enumerate(zip(scenarios, labels, colors)):
-        sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-        params = get_scenario_params(scenario)
-        sim.set_parameters(
-            D_Q=params['D_Q'],
-            alpha_D=params['alpha_D'],
-            alpha_A=params['alpha_A'],
-            beta_E=params['beta_E'],
-            gamma_0=0.01, gamma_1=0.02, gamma_2=0.02, gamma_3=0.02
-        )
-        sim.initialize(scenario, seed=42)
-        history = sim.run(save_interval=10, verbose=False)
+        artifact = load_artifacts('empirical')[scenario]
         
-        time = history['time']
+        time = artifact.time
         
         # Plot each component
         for col, comp in enumerate(['q0', 'q1', 'q2', 'q3']):
             ax = axes[row, col]
-            q_vals = np.array([Q[col] for Q in history['Q']])
-            q_mean = np.mean(q_vals, axis=(1,2))
-            q_std = np.std(q_vals, axis=(1,2))
+            q_mean = artifact.q_mean[:, col]
+            q_std = artifact.q_std[:, col]
             
             ax.plot(time, q_mean, color=color, linewidth=2, label=label)
             ax.fill_between(time, q_mean-q_std, q_mean+q_std, color=color, alpha=0.2)
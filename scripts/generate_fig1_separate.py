@@ -4,14 +4,9 @@ Generate Separate Quaternion Component Figures
 
 import numpy as np
 import matplotlib.pyplot as plt
-import json
 import sys
 sys.path.append('.')
-from quaternion_simulator import QuaternionFieldSimulator
-
-# Load empirical parameters
-with open('../data/empirical_parameters.json', 'r') as f:
-    emp_params = json.load(f)
+from scenario_artifacts import load_artifacts
 
 FIGURE_DIR = '../figures'
 
@@ -19,20 +14,9 @@ def generate_scenario_figure(scenario, label, color, fig_num):
     """Generate 4x1 figure for one scenario"""
     print(f"Generating Figure {fig_num}: {label} Quaternion Components...")
     
-    # Run simulation
-    sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-    params = emp_params['simulation_parameters'][scenario]
-    sim.set_parameters(
-        D_Q=params['D_Q'],
-        alpha_D=params['alpha_D'],
-        alpha_A=params['alpha_A'],
-        beta_E=params['beta_E'],
-        gamma_0=0.01, gamma_1=0.02, gamma_2=0.02, gamma_3=0.02
-    )
-    sim.initialize(scenario, seed=42)
-    history = sim.run(save_interval=10, verbose=False)
+    artifact = load_artifacts('empirical')[scenario]
     
-    time = history['time']
+    time = artifact.time
     
     # Create figure with 4 subplots (2 rows, 2 columns)
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
@@ -42,9 +26,8 @@ def generate_scenario_figure(scenario, label, color, fig_num):
     
     for idx, (comp_idx, comp_name) in enumerate(zip([0, 1, 2, 3], component_names)):
         ax = axes[idx]
-        q_vals = np.array([Q[comp_idx] for Q in history['Q']])
-        q_mean = np.mean(q_vals, axis=(1,2))
-        q_std = np.std(q_vals, axis=(1,2))
+        q_mean = artifact.q_mean[:, comp_idx]
+        q_std = artifact.q_std[:, comp_idx]
         
         ax.plot(time, q_mean, color=color, linewidth=2.5)
         ax.fill_between(time, q_mean-q_std, q_mean+q_std, color=color, alpha=0.25)
@@ -5,14 +5,9 @@ Generate Algebraic Chain Trajectories in 3D
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-import json
 import sys
 sys.path.append('.')
-from quaternion_simulator import QuaternionFieldSimulator
-
-# Load empirical parameters
-with open('../data/empirical_parameters.json', 'r') as f:
-    emp_params = json.load(f)
+from scenario_artifacts import load_artifacts
 
 FIGURE_DIR = '../figures'
 
@@ -29,23 +24,10 @@ def generate_fig2_trajectories():
     alphas = [0.7, 0.7, 0.9]
     
     for scenario, label, color, alpha in zip(scenarios, labels, colors, alphas):
-        # Run simulation
-        sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-        params = emp_params['simulation_parameters'][scenario]
-        sim.set_parameters(
-            D_Q=params['D_Q'],
-            alpha_D=params['alpha_D'],
-            alpha_A=params['alpha_A'],
-            beta_E=params['beta_E'],
-            gamma_0=0.01, gamma_1=0.02, gamma_2=0.02, gamma_3=0.02
-        )
-        sim.initialize(scenario, seed=42)
-        history = sim.run(save_interval=10, verbose=False)
+        artifact = load_artifacts('empirical')[scenario]
         
-        # Extract spatial mean of q1, q2, q3
-        q1_traj = [np.mean(Q[1]) for Q in history['Q']]
-        q2_traj = [np.mean(Q[2]) for Q in history['Q']]
-        q3_traj = [np.mean(Q[3]) for Q in history['Q']]
+        # Spatial mean of q1, q2, q3
+        q1_traj, q2_traj, q3_traj = artifact.q_mean[:, 1:].T
         
         # Plot trajectory
         ax.plot(q1_traj, q2_traj, q3_traj, 
@@ -4,14 +4,9 @@ Generate Coherence Order Parameter (Collapse Metric) Figure
 
 import numpy as np
 import matplotlib.pyplot as plt
-import json
 import sys
 sys.path.append('.')
-from quaternion_simulator import QuaternionFieldSimulator
-
-# Load empirical parameters
-with open('../data/empirical_parameters.json', 'r') as f:
-    emp_params = json.load(f)
+from scenario_artifacts import load_artifacts
 
 FIGURE_DIR = '../figures'
 
@@ -28,21 +23,10 @@ def generate_fig3_coherence():
     linewidths = [2.5, 2.5, 3.0]
     
     for scenario, label, color, ls, lw in zip(scenarios, labels, colors, linestyles, linewidths):
-        # Run simulation
-        sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-        params = emp_params['simulation_parameters'][scenario]
-        sim.set_parameters(
-            D_Q=params['D_Q'],
-            alpha_D=params['alpha_D'],
-            alpha_A=params['alpha_A'],
-            beta_E=params['beta_E'],
-            gamma_0=0.01, gamma_1=0.02, gamma_2=0.02, gamma_3=0.02
-        )
-        sim.initialize(scenario, seed=42)
-        history = sim.run(save_interval=10, verbose=False)
+        artifact = load_artifacts('empirical')[scenario]
         
-        time = history['time']
-        chi = history['chi']
+        time = artifact.time
+        chi = artifact.chi
         
         # Plot
         ax.plot(time, chi, color=color, linestyle=ls, linewidth=lw, 
@@ -4,14 +4,9 @@ Generate Entropy and Dopamine Field Heatmaps
 
 import numpy as np
 import matplotlib.pyplot as plt
-import json
 import sys
 sys.path.append('.')
-from quaternion_simulator import QuaternionFieldSimulator
-
-# Load empirical parameters
-with open('../data/empirical_parameters.json', 'r') as f:
-    emp_params = json.load(f)
+from scenario_artifacts import load_artifacts
 
 FIGURE_DIR = '../figures'
 
@@ -25,22 +20,11 @@ def generate_fig4_fields():
     labels = ['Healthy', 'Degenerative', 'REN-01']
     
     for col, (scenario, label) in enumerate(zip(scenarios, labels)):
-        # Run simulation
-        sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-        params = emp_params['simulation_parameters'][scenario]
-        sim.set_parameters(
-            D_Q=params['D_Q'],
-            alpha_D=params['alpha_D'],
-            alpha_A=params['alpha_A'],
-            beta_E=params['beta_E'],
-            gamma_0=0.01, gamma_1=0.02, gamma_2=0.02, gamma_3=0.02
-        )
-        sim.initialize(scenario, seed=42)
-        history = sim.run(save_interval=10, verbose=False)
+        artifact = load_artifacts('empirical')[scenario]
         
-        # Get final state
-        phi_E_final = history['phi_E'][-1]
-        psi_D_final = history['psi_D'][-1]
+        # Final state
+        phi_E_final = artifact.final_phi_E
+        psi_D_final = artifact.final_psi_D
         
         # Top row: Entropy field
         ax_entropy = axes[0, col]
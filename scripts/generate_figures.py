@@ -6,9 +6,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib import cm
-import pickle
 import os
 
+from scenario_artifacts import load_artifacts
+
 # Set style
 plt.rcParams['font.family'] = 'serif'
 plt.rcParams['font.size'] = 12
@@ -17,14 +18,13 @@ plt.rcParams['figure.dpi'] = 150
 
 
 def load_results():
-    """Load simulation results."""
-    with open('/home/ubuntu/REN-01/simulations/output/all_scenarios_results.pkl', 'rb') as f:
-        return pickle.load(f)
+    """Scenario artifacts of the reference parameter sets (simulated on first use)."""
+    return load_artifacts('reference')
 
 
 def generate_entropy_field_degenerative(results, output_dir):
     """Generate entropy field visualization for degenerative state."""
-    phi_E = results['degenerative']['phi_E'][-1]  # Final state
+    phi_E = results['degenerative'].final_phi_E  # Final state
     
     fig, ax = plt.subplots(figsize=(10, 8))
     im = ax.imshow(phi_E, cmap='viridis', origin='lower', aspect='equal')
@@ -42,7 +42,7 @@ def generate_entropy_field_degenerative(results, output_dir):
 
 def generate_dopamine_field_ren01(results, output_dir):
     """Generate dopamine field visualization for REN-01 treatment."""
-    psi_D = results['ren01']['psi_D'][-1]  # Final state
+    psi_D = results['ren01'].final_psi_D  # Final state
     
     fig, ax = plt.subplots(figsize=(10, 8))
     im = ax.imshow(psi_D, cmap='plasma', origin='lower', aspect='equal')
@@ -62,11 +62,11 @@ def generate_collapse_metric_comparison(results, output_dir):
     """Generate collapse metric time series comparison."""
     fig, ax = plt.subplots(figsize=(12, 6))
     
-    time = results['healthy']['time']
+    time = results['healthy'].time
     
-    ax.plot(time, results['healthy']['chi'], 'g-', linewidth=2, label='Healthy')
-    ax.plot(time, results['degenerative']['chi'], 'r-', linewidth=2, label='Degenerative')
-    ax.plot(time, results['ren01']['chi'], 'b-', linewidth=2, label='REN-01')
+    ax.plot(time, results['healthy'].chi, 'g-', linewidth=2, label='Healthy')
+    ax.plot(time, results['degenerative'].chi, 'r-', linewidth=2, label='Degenerative')
+    ax.plot(time, results['ren01'].chi, 'b-', linewidth=2, label='REN-01')
     
     # Add threshold line
     ax.axhline(y=1.0, color='k', linestyle='--', linewidth=1, alpha=0.7, label=r'$\chi = 1$ threshold')
@@ -90,8 +90,8 @@ def generate_quaternion_components(results, output_dir):
     for scenario in ['healthy', 'ren01']:
         fig, axes = plt.subplots(2, 2, figsize=(12, 10))
         
-        time = results[scenario]['time']
-        q_norms = np.array(results[scenario]['q_norms'])
+        time = results[scenario].time
+        q_norms = results[scenario].q_norms
         
         labels = [r'$q_0$ (Dopaminergic)', r'$q_1$ (Entropy-i)', 
                   r'$q_2$ (Astrocytic)', r'$q_3$ (Entropy-k)']
@@ -171,7 +171,7 @@ def generate_entropy_dopamine_vector_field(results, output_dir):
 def generate_collapse_metric_field(results, output_dir):
     """Generate spatial collapse metric visualization."""
     # Compute local chi-like quantity from final state
-    Q_final = results['ren01']['Q'][-1]
+    Q_final = results['ren01'].final_Q
     
     # Local collapse indicator: q0^2 / (q1^2 + q2^2 + q3^2 + 0.1)
     q0_sq = Q_final[0]**2
@@ -240,7 +240,7 @@ def generate_patient_trajectory(results, output_dir):
 
 def generate_astrocyte_field(results, output_dir):
     """Generate astrocyte field visualization."""
-    A = results['ren01']['A'][-1]  # Final state
+    A = results['ren01'].final_A  # Final state
     
     fig, ax = plt.subplots(figsize=(10, 8))
     im = ax.imshow(A, cmap='Blues', origin='lower', aspect='equal')
@@ -264,7 +264,7 @@ def generate_quaternion_attractor(results, output_dir):
     for scenario, color, label in [('healthy', 'green', 'Healthy'), 
                                     ('degenerative', 'red', 'Degenerative'),
                                     ('ren01', 'blue', 'REN-01')]:
-        q_norms = np.array(results[scenario]['q_norms'])
+        q_norms = results[scenario].q_norms
         ax.plot(q_norms[:, 1], q_norms[:, 2], q_norms[:, 3], 
                 color=color, linewidth=2, label=label, alpha=0.8)
         # Mark start and end
@@ -290,12 +290,12 @@ def generate_coherence_order_parameter(results, output_dir):
     """Generate coherence order parameter visualization."""
     fig, ax = plt.subplots(figsize=(12, 6))
     
-    time = results['healthy']['time']
+    time = results['healthy'].time
     
     for scenario, color, label in [('healthy', 'green', 'Healthy'), 
                                     ('degenerative', 'red', 'Degenerative'),
                                     ('ren01', 'blue', 'REN-01')]:
-        q_norms = np.array(results[scenario]['q_norms'])
+        q_norms = results[scenario].q_norms
         # Coherence: q0 / sqrt(q1^2 + q2^2 + q3^2)
         coherence = q_norms[:, 0] / np.sqrt(q_norms[:, 1]**2 + q_norms[:, 2]**2 + q_norms[:, 3]**2 + 0.01)
         ax.plot(time, coherence, color=color, linewidth=2, label=label)
@@ -324,10 +324,7 @@ def generate_algebraic_chain_evolution(results, output_dir):
                                     ('degenerative', 'red', 'Degenerative'),
                                     ('ren01', 'blue', 'REN-01')]:
         # Use spatial mean of Q components
-        Q_history = results[scenario]['Q']
-        q1_mean = [np.mean(Q[1]) for Q in Q_history]
-        q2_mean = [np.mean(Q[2]) for Q in Q_history]
-        q3_mean = [np.mean(Q[3]) for Q in Q_history]
+        q1_mean, q2_mean, q3_mean = results[scenario].q_mean[:, 1:].T
         
         ax.plot(q1_mean, q2_mean, q3_mean, color=color, linewidth=2, 
                 label=label, alpha=0.8)
@@ -0,0 +1,333 @@
+"""
+REN-01 Parallel Quaternion Field Simulator
+Strip-decomposed semi-implicit Euler stepping for very large grids.
+
+The (4, Nx, Ny) field lives in a multiprocessing.shared_memory block holding
+two states (current and next). Each worker process owns a contiguous strip
+of rows. Per step it reads the one-cell halo rows of its neighbours straight
+from the shared current state, evaluates forcing, Laplacian and update for
+its strip and writes the result into the shared next state; a barrier then
+ends the step and the two states swap roles. The chi and q_norms integrals
+are reduced from per-strip partial sums, so the field is never copied
+through the parent process.
+
+Every cell follows the arithmetic of QuaternionFieldSimulator.step(), so the
+fields are bit-identical to a serial run; chi and q_norms agree to round-off
+(only the order of the global sums differs).
+"""
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+
+import numpy as np
+
+from quaternion_simulator import (History, PeriodicLaplacian, scenario_initial_field,
+                                  strip_bounds, strip_step)
+
+
+# Worker commands
+_STOP, _STEP, _REDUCE = 0, 1, 2
+
+# Per-strip partial sums: sum(q_i^2) for i = 0..3, sum(phi_E), and
+# sum(|grad q_i|^2) for i = 0..3
+_N_PARTIALS = 9
+
+
+def strip_partials(Q, rows, dx):
+    """
+    Partial sums of the chi and q_norms integrands over rows [start, stop).
+    
+    The row derivative uses the neighbouring rows where they exist, so the
+    strips together reproduce np.gradient over the whole grid (central
+    differences inside, one-sided at global rows 0 and Nx-1).
+    
+    Returns:
+        Array of _N_PARTIALS float64 sums (see module constant)
+    """
+    start, stop = rows
+    Nx = Q.shape[1]
+    lo, hi = max(start - 1, 0), min(stop + 1, Nx)
+    strip = Q[:, start:stop]
+    
+    partials = np.zeros(_N_PARTIALS)
+    for i in range(4):
+        partials[i] = np.sum(strip[i]**2, dtype=np.float64)
+    phi_E = strip[1]**2 + strip[2]**2 + strip[3]**2
+    partials[4] = np.sum(phi_E, dtype=np.float64)
+    
+    for i in range(4):
+        grad_x = np.gradient(Q[i, lo:hi], axis=0)[start - lo:stop - lo] / dx
+        grad_y = np.gradient(strip[i], axis=1) / dx
+        partials[5 + i] = np.sum(grad_x**2 + grad_y**2, dtype=np.float64)
+    return partials
+
+
+def _strip_worker(rank, n_strips, rows, shape, names, params, dx, dt, barrier, step_barrier):
+    """Worker process: wait for commands and apply them to its strip."""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    fields = np.ndarray((2,) + shape, dtype=np.float64, buffer=blocks[0].buf)
+    control = np.ndarray(3, dtype=np.int64, buffer=blocks[1].buf)
+    partials = np.ndarray((n_strips, _N_PARTIALS), dtype=np.float64, buffer=blocks[2].buf)
+    stencil = PeriodicLaplacian((4, rows[1] - rows[0], shape[2]), dx)
+    
+    try:
+        while True:
+            barrier.wait()
+            command, n_steps, current = (int(value) for value in control)
+            if command == _STOP:
+                break
+            if command == _STEP:
+                for _ in range(n_steps):
+                    strip_step(fields[current], fields[1 - current], rows,
+                               stencil, dt, **params)
+                    # Nobody may read halos of the next state before it is
+                    # complete, or overwrite this state while it is read
+                    step_barrier.wait()
+                    current = 1 - current
+            elif command == _REDUCE:
+                partials[rank] = strip_partials(fields[current], rows, dx)
+            barrier.wait()
+    except BaseException:
+        barrier.abort()
+        step_barrier.abort()
+        raise
+    finally:
+        # Views must be released before the blocks can be closed
+        del fields, control, partials
+        for block in blocks:
+            block.close()
+
+
+class ParallelQuaternionSimulator:
+    """REN-01 quaternion field simulation split into row strips across processes."""
+    
+    def __init__(self, Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0, n_workers=None):
+        """
+        Initialize parallel simulator.
+        
+        Parameters:
+            Lx, Ly: Domain size
+            dx: Grid spacing
+            dt: Time step
+            T: Total simulation time
+            n_workers: Number of worker processes / row strips
+                       (default: os.cpu_count(), at most Nx)
+        """
+        self.Lx, self.Ly = Lx, Ly
+        self.dx, self.dt, self.T = dx, dt, T
+        self.Nx, self.Ny = int(Lx/dx), int(Ly/dx)
+        self.Nt = int(T/dt)
+        self.n_workers = max(1, min(n_workers or os.cpu_count() or 1, self.Nx))
+        self.strips = strip_bounds(self.Nx, self.n_workers)
+        
+        # Shared blocks: both field states, control word, per-strip partials
+        shape = (4, self.Nx, self.Ny)
+        self._blocks = [
+            shared_memory.SharedMemory(create=True, size=2 * int(np.prod(shape)) * 8),
+            shared_memory.SharedMemory(create=True, size=3 * 8),
+            shared_memory.SharedMemory(create=True, size=self.n_workers * _N_PARTIALS * 8)
+        ]
+        self._fields = np.ndarray((2,) + shape, dtype=np.float64, buffer=self._blocks[0].buf)
+        self._control = np.ndarray(3, dtype=np.int64, buffer=self._blocks[1].buf)
+        self._partials = np.ndarray((self.n_workers, _N_PARTIALS), dtype=np.float64,
+                                    buffer=self._blocks[2].buf)
+        self._fields.fill(0)
+        self._control.fill(0)
+        self._current = 0
+        self._workers = None
+        
+        # History storage (scalars only; gathering full 4096^2 snapshots
+        # would defeat the decomposition)
+        self.history = History()
+    
+    @property
+    def Q(self):
+        """Current quaternion field, a (4, Nx, Ny) view of shared memory."""
+        return self._fields[self._current]
+    
+    @Q.setter
+    def Q(self, value):
+        np.copyto(self._fields[self._current], value)
+    
+    def set_parameters(self, D_Q, alpha_D, alpha_A, beta_E,
+                       gamma_0, gamma_1, gamma_2, gamma_3):
+        """Set evolution parameters (takes effect at the next start())."""
+        self.D_Q = D_Q
+        self.alpha_D = alpha_D
+        self.alpha_A = alpha_A
+        self.beta_E = beta_E
+        self.gamma_0 = gamma_0
+        self.gamma_1 = gamma_1
+        self.gamma_2 = gamma_2
+        self.gamma_3 = gamma_3
+    
+    def initialize(self, scenario='healthy', seed=42):
+        """Initialize the field as QuaternionFieldSimulator.initialize()."""
+        scenario_initial_field(self.Q, scenario, seed)
+    
+    def start(self):
+        """Start the worker processes (run() does this automatically)."""
+        if self._workers is not None:
+            return
+        params = {name: getattr(self, name) for name in
+                  ('D_Q', 'alpha_D', 'alpha_A', 'beta_E', 'gamma_0')}
+        names = [block.name for block in self._blocks]
+        self._barrier = multiprocessing.Barrier(self.n_workers + 1)
+        step_barrier = multiprocessing.Barrier(self.n_workers)
+        
+        self._workers = []
+        for rank, rows in enumerate(self.strips):
+            worker = multiprocessing.Process(
+                target=_strip_worker,
+                args=(rank, self.n_workers, rows, self.Q.shape, names, params, self.dx, self.dt,
+                      self._barrier, step_barrier),
+                daemon=True)
+            worker.start()
+            self._workers.append(worker)
+    
+    def stop(self):
+        """Stop the worker processes."""
+        if self._workers is None:
+            return
+        try:
+            self._dispatch(_STOP, wait=False)
+        except RuntimeError:
+            pass
+        for worker in self._workers:
+            worker.join()
+        self._workers = None
+    
+    def close(self):
+        """Stop the workers and release the shared memory."""
+        self.stop()
+        del self._fields, self._control, self._partials
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _dispatch(self, command, n_steps=0, wait=True):
+        """Hand one command to all workers and wait until they have finished it."""
+        self._control[:] = (command, n_steps, self._current)
+        try:
+            self._barrier.wait()
+            if wait:
+                self._barrier.wait()
+        except BrokenBarrierError:
+            raise RuntimeError("A worker process failed; see its traceback above") from None
+    
+    def advance(self, n_steps):
+        """Advance the field by n_steps time steps."""
+        if n_steps <= 0:
+            return
+        if self._workers is None:
+            self.start()
+            try:
+                self.advance(n_steps)
+            finally:
+                self.stop()
+            return
+        self._dispatch(_STEP, n_steps)
+        self._current = (self._current + n_steps) % 2
+    
+    def _reduce(self):
+        """Global sums of the chi and q_norms integrands."""
+        if self._workers is None:
+            # Same strip partials evaluated in this process
+            for rank, rows in enumerate(self.strips):
+                self._partials[rank] = strip_partials(self.Q, rows, self.dx)
+        else:
+            self._dispatch(_REDUCE)
+        return np.sum(self._partials, axis=0)
+    
+    def compute_chi(self, sums=None):
+        """
+        Compute the generator-consistent collapse metric from strip partial sums.
+        
+        Parameters:
+            sums: Reduced partial sums from _reduce() (computed if omitted)
+        """
+        if sums is None:
+            sums = self._reduce()
+        cell_area = self.dx**2
+        
+        q0_norm_sq = sums[0] * cell_area
+        q2_norm_sq = sums[2] * cell_area
+        phi_E_integral = sums[4] * cell_area
+        
+        numerator = (self.alpha_D * q0_norm_sq +
+                     self.alpha_A * q2_norm_sq +
+                     self.beta_E * phi_E_integral)
+        
+        grad_Q_sq = 0
+        for i in range(4):
+            grad_Q_sq += sums[5 + i] * self.dx**2
+        
+        denominator = grad_Q_sq + self.gamma_0
+        
+        return numerator / denominator if denominator > 0 else 0.0
+    
+    def compute_q_norms(self, sums=None):
+        """L2 norms of the four components from strip partial sums."""
+        if sums is None:
+            sums = self._reduce()
+        return [float(np.sqrt(sums[i] * self.dx**2)) for i in range(4)]
+    
+    def run(self, save_interval=20, verbose=True):
+        """
+        Run simulation with the same save schedule as QuaternionFieldSimulator.run().
+        
+        Parameters:
+            save_interval: Save observables every N steps
+            verbose: Print progress
+        
+        Returns:
+            history: History with 'time', 'chi' and 'q_norms'
+        """
+        n_saves = len(range(0, self.Nt, save_interval))
+        self.history.reserve('time', n_saves)
+        self.history.reserve('chi', n_saves)
+        self.history.reserve('q_norms', n_saves, (4,))
+        
+        started = self._workers is None
+        self.start()
+        try:
+            n_done = 0
+            for n in range(0, self.Nt, save_interval):
+                self.advance(n + 1 - n_done)
+                n_done = n + 1
+                
+                t = n * self.dt
+                sums = self._reduce()
+                self.history.append('time', t)
+                self.history.append('chi', self.compute_chi(sums))
+                self.history.append('q_norms', self.compute_q_norms(sums))
+                
+                if verbose and n % 200 == 0:
+                    print(f"Step {n}/{self.Nt}, t={t:.2f}, chi={self.history['chi'][-1]:.4f}")
+            
+            self.advance(self.Nt - n_done)
+        finally:
+            if started:
+                self.stop()
+        
+        return self.history
+
+
+if __name__ == '__main__':
+    from quaternion_simulator import get_healthy_parameters
+    
+    # Test run
+    with ParallelQuaternionSimulator(Lx=256, Ly=256, dx=1.0, dt=0.02, T=10.0) as sim:
+        sim.set_parameters(**get_healthy_parameters())
+        sim.initialize('healthy')
+        history = sim.run(save_interval=20, verbose=True)
+        print(f"Final chi: {history['chi'][-1]:.4f} ({sim.n_workers} workers)")
@@ -19,13 +19,433 @@ Collapse metric:
     chi(t) = (alpha_D*||q0||^2 + alpha_A*||q2||^2 + beta_E*integral(phi_E)) / (integral(||nabla Q||^2) + gamma_0)
 """
 
+import functools
+import os
+import pickle
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+from snapshot_store import MEMORY_BUDGET, SnapshotStore
+
+try:
+    import numba
+except ImportError:  # optional JIT backend
+    numba = None
+
+
+class PeriodicLaplacian:
+    """
+    Fused periodic 5-point Laplacian over the last two axes of a field stack.
+    
+    All components (and any other leading axes) are handled in one pass: the
+    stack is copied into a halo-padded buffer whose ghost rows and columns
+    hold the periodic neighbours, and the stencil is then evaluated with slice
+    arithmetic on the flattened buffer. Every operand is contiguous, so NumPy
+    needs no iteration buffers, and the result is bit-identical to
+    QuaternionFieldSimulator.laplacian() applied component by component.
+    """
+    
+    def __init__(self, shape, dx, dtype=np.float64):
+        """
+        Parameters:
+            shape: Shape of the fields to differentiate, e.g. (4, Nx, Ny)
+            dx: Grid spacing
+            dtype: Field dtype
+        """
+        self.shape = tuple(shape)
+        self.dx = dx
+        *lead, Nx, Ny = self.shape
+        padded_shape = (*lead, Nx + 2, Ny + 2)
+        self.padded = np.zeros(padded_shape, dtype=dtype)
+        self.sums = np.zeros(padded_shape, dtype=dtype)
+        self.scratch = np.zeros(padded_shape, dtype=dtype)
+    
+    def __call__(self, Q, out=None, above=None, below=None):
+        """
+        Return the Laplacian of Q, written into out if given.
+        
+        Parameters:
+            Q: Fields of shape self.shape
+            out: Optional output array of the same shape
+            above, below: Ghost rows preceding the first and following the
+                          last row of Q (shape of Q[..., 0, :]); by default
+                          Q wraps around periodically. Passing the
+                          neighbouring rows lets Q be one strip of a larger
+                          periodic grid.
+        """
+        if out is None:
+            out = np.empty(self.shape, dtype=self.padded.dtype)
+        P, S, W = self.padded, self.sums, self.scratch
+        
+        # Interior plus ghost rows (periodic unless halo rows are given)
+        np.copyto(P[..., 1:-1, 1:-1], Q)
+        np.copyto(P[..., 0, 1:-1], Q[..., -1, :] if above is None else above)
+        np.copyto(P[..., -1, 1:-1], Q[..., 0, :] if below is None else below)
+        
+        # Ghost columns of every padded row at once, as 1D strided copies
+        # over the flattened buffer (a row step is Ny + 2 elements)
+        R = P.shape[-1]
+        Pf, Sf, Wf = P.reshape(-1), S.reshape(-1), W.reshape(-1)
+        L = Pf.size
+        np.copyto(Pf[0::R], Pf[R - 2::R])
+        np.copyto(Pf[R - 1::R], Pf[1::R])
+        
+        # Stencil on the flattened buffer; positions in ghost cells receive
+        # meaningless values and are dropped
+        np.add(Pf[:L - 2*R], Pf[2*R:], out=Sf[R:L - R])
+        np.add(Pf[R - 1:L - R - 1], Pf[R + 1:L - R + 1], out=Wf[R:L - R])
+        np.add(Sf, Wf, out=Sf)
+        np.multiply(Pf, 4, out=Wf)
+        np.subtract(Sf, Wf, out=Sf)
+        np.divide(Sf, self.dx**2, out=Sf)
+        
+        np.copyto(out, S[..., 1:-1, 1:-1])
+        return out
+
+
+@functools.lru_cache(maxsize=None)
+def laplacian_symbol(Nx, Ny, dx):
+    """
+    Fourier symbol of the periodic 5-point Laplacian on the rfft2 grid.
+    
+    Returns the read-only array -k^2 of shape (Nx, Ny//2 + 1), where
+    k^2 = (4/dx^2) * (sin^2(kx*dx/2) + sin^2(ky*dx/2)) is the modified
+    wavenumber of the stencil used by laplacian(). Diffusion solved with this
+    symbol is exact for the same spatial discretization as step(). Cached per
+    (Nx, Ny, dx).
+    """
+    kx = 2 * np.pi * np.fft.fftfreq(Nx, d=dx)
+    ky = 2 * np.pi * np.fft.rfftfreq(Ny, d=dx)
+    k2 = (4 / dx**2) * (np.sin(kx * dx / 2)[:, np.newaxis]**2 +
+                        np.sin(ky * dx / 2)[np.newaxis, :]**2)
+    symbol = -k2
+    symbol.flags.writeable = False
+    return symbol
+
+
+@functools.lru_cache(maxsize=16)
+def etdrk4_coefficients(Nx, Ny, dx, dt, D_Q, gamma_0, n_contour=32, dtype=np.float64):
+    """
+    ETDRK4 coefficients for the diagonal linear operator L = D_Q*nabla^2 - gamma_0.
+    
+    The phi-function combinations of Cox & Matthews are evaluated with the
+    contour-integral method of Kassam & Trefethen (2005): each coefficient
+    is averaged over n_contour points on a unit circle around dt*L, which
+    avoids the cancellation error of the explicit formulas near L = 0.
+    Cached per (grid, dt, D_Q, gamma_0). The coefficients are always
+    evaluated in float64 and then cast to dtype.
+    
+    Returns:
+        (E, E2, Qc, f1, f2, f3): Read-only arrays on the rfft2 grid
+    """
+    L = D_Q * laplacian_symbol(Nx, Ny, dx) - gamma_0
+    E = np.exp(dt * L)
+    E2 = np.exp(dt * L / 2)
+    
+    roots = np.exp(1j * np.pi * (np.arange(1, n_contour + 1) - 0.5) / n_contour)
+    Qc, f1, f2, f3 = (np.empty_like(L) for _ in range(4))
+    
+    # Contour points add a trailing axis; evaluate in row blocks to bound memory
+    block = max(1, 2**22 // (L.shape[1] * n_contour))
+    for start in range(0, L.shape[0], block):
+        rows = slice(start, start + block)
+        LR = dt * L[rows, :, np.newaxis] + roots
+        eLR = np.exp(LR)
+        Qc[rows] = dt * np.real(np.mean((np.exp(LR / 2) - 1) / LR, axis=-1))
+        f1[rows] = dt * np.real(np.mean(
+            (-4 - LR + eLR * (4 - 3*LR + LR**2)) / LR**3, axis=-1))
+        f2[rows] = dt * np.real(np.mean(
+            (2 + LR + eLR * (LR - 2)) / LR**3, axis=-1))
+        f3[rows] = dt * np.real(np.mean(
+            (-4 - 3*LR - LR**2 + eLR * (4 - LR)) / LR**3, axis=-1))
+    
+    coefficients = tuple(array.astype(dtype) for array in (E, E2, Qc, f1, f2, f3))
+    for array in coefficients:
+        array.flags.writeable = False
+    return coefficients
+
+
+def quaternion_forcing(Q, alpha_D, alpha_A, beta_E, phi_E=None):
+    """
+    Nonlinear forcing N(Q) = alpha_D*i*Q + alpha_A*j*Q - beta_E*phi_E*i*Q.
+    
+    Parameters:
+        Q: Field stack whose first axis holds q0..q3 (any trailing shape,
+           e.g. a full grid or a strip of rows)
+        alpha_D, alpha_A, beta_E: Forcing coefficients
+        phi_E: Precomputed q1^2 + q2^2 + q3^2 of Q, if already available
+    """
+    q0, q1, q2, q3 = Q[0], Q[1], Q[2], Q[3]
+    if phi_E is None:
+        phi_E = q1**2 + q2**2 + q3**2
+    
+    N = np.zeros_like(Q)
+    
+    # alpha_D * i*Q = alpha_D * (-q1 + q0*i - q3*j + q2*k)
+    N[0] -= alpha_D * q1
+    N[1] += alpha_D * q0
+    N[2] -= alpha_D * q3
+    N[3] += alpha_D * q2
+    
+    # alpha_A * j*Q = alpha_A * (-q2 + q3*i + q0*j - q1*k)
+    N[0] -= alpha_A * q2
+    N[1] += alpha_A * q3
+    N[2] += alpha_A * q0
+    N[3] -= alpha_A * q1
+    
+    # -beta_E * phi_E * i*Q
+    N[0] += beta_E * phi_E * q1
+    N[1] -= beta_E * phi_E * q0
+    N[2] += beta_E * phi_E * q3
+    N[3] -= beta_E * phi_E * q2
+    
+    return N
+
+
+def strip_bounds(Nx, n_strips):
+    """Split rows 0..Nx-1 into n_strips contiguous (start, stop) ranges."""
+    return [(int(rows[0]), int(rows[-1]) + 1)
+            for rows in np.array_split(np.arange(Nx), n_strips)]
+
+
+def strip_step(src, dst, rows, stencil, dt, D_Q, alpha_D, alpha_A, beta_E, gamma_0):
+    """
+    One semi-implicit Euler step for rows [start, stop) of a periodic field.
+    
+    Same arithmetic per cell as QuaternionFieldSimulator.step(), so strips
+    stepped independently (by threads or processes) assemble the identical
+    field.
+    
+    Parameters:
+        src: Current full field (4, Nx, Ny); only the strip and its two
+             halo rows are read
+        dst: Next full field; only the strip is written
+        rows: (start, stop) row range
+        stencil: PeriodicLaplacian of shape (4, stop - start, Ny)
+        dt: Time step
+        D_Q, alpha_D, alpha_A, beta_E, gamma_0: Evolution parameters
+    """
+    start, stop = rows
+    Nx = src.shape[1]
+    Q = src[:, start:stop]
+    
+    N = quaternion_forcing(Q, alpha_D, alpha_A, beta_E)
+    rhs = Q + dt * N
+    lap = stencil(Q, above=src[:, (start - 1) % Nx], below=src[:, stop % Nx])
+    np.divide(rhs + dt * D_Q * lap, 1 + dt * gamma_0, out=dst[:, start:stop])
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _euler_kernel(Q, Q_next, n_steps, dt, dx2, dt_D_Q, decay,
+                      alpha_D, alpha_A, beta_E):
+        """
+        Fused semi-implicit Euler steps, one parallel loop over grid rows.
+        
+        Forcing, Laplacian and update are evaluated per cell with the same
+        operation order as the NumPy path. Q and Q_next are used as
+        ping-pong buffers; after an odd number of steps the result is in
+        Q_next, otherwise in Q.
+        """
+        Nx, Ny = Q.shape[1], Q.shape[2]
+        src, dst = Q, Q_next
+        for _ in range(n_steps):
+            for i in numba.prange(Nx):
+                im = i - 1 if i > 0 else Nx - 1
+                ip = i + 1 if i < Nx - 1 else 0
+                for j in range(Ny):
+                    jm = j - 1 if j > 0 else Ny - 1
+                    jp = j + 1 if j < Ny - 1 else 0
+                    q0 = src[0, i, j]
+                    q1 = src[1, i, j]
+                    q2 = src[2, i, j]
+                    q3 = src[3, i, j]
+                    
+                    phi_E = q1*q1 + q2*q2 + q3*q3
+                    bphi = beta_E * phi_E
+                    n0 = ((0.0 - alpha_D*q1) - alpha_A*q2) + bphi*q1
+                    n1 = ((0.0 + alpha_D*q0) + alpha_A*q3) - bphi*q0
+                    n2 = ((0.0 - alpha_D*q3) + alpha_A*q0) + bphi*q3
+                    n3 = ((0.0 + alpha_D*q2) - alpha_A*q1) - bphi*q2
+                    
+                    for c in range(4):
+                        center = src[c, i, j]
+                        lap = (((src[c, im, j] + src[c, ip, j]) +
+                                (src[c, i, jm] + src[c, i, jp])) - 4*center) / dx2
+                        if c == 0:
+                            n_c = n0
+                        elif c == 1:
+                            n_c = n1
+                        elif c == 2:
+                            n_c = n2
+                        else:
+                            n_c = n3
+                        dst[c, i, j] = ((center + dt*n_c) + dt_D_Q*lap) / decay
+            src, dst = dst, src
+
+
+# Evolution parameters accepted by set_parameters()
+PARAMETER_NAMES = ('D_Q', 'alpha_D', 'alpha_A', 'beta_E',
+                   'gamma_0', 'gamma_1', 'gamma_2', 'gamma_3')
+
+# Observables run() can record at each save point, and named recorder specs
+RECORDABLE = ('Q', 'phi_E', 'psi_D', 'A', 'chi', 'q_norms')
+RECORD_PRESETS = {'scalars': ('chi', 'q_norms'), 'all': RECORDABLE}
+
+# Format of the files written by run(checkpoint=...)
+CHECKPOINT_VERSION = 1
+
+
+class History:
+    """
+    Simulation history stored in contiguous arrays, one row per entry.
+    
+    run() preallocates every recorded observable for the save points it will
+    produce, so history['q_norms'] is an (Nsave, 4) array and history['Q'] an
+    (Nsave, 4, Nx, Ny) array, ready for vectorized post-processing over time.
+    Observables are also attributes (history.chi). Dictionary-style access,
+    `in`, iteration over names, keys() and items() keep scripts written for
+    the former dict of lists working. Reads return views of the filled rows.
+    
+    An observable reserved as a ring buffer keeps only its last K entries in
+    fixed memory; reading it returns them oldest first (a copy once the ring
+    has wrapped around).
+    """
+    
+    FIELDS = RECORDABLE + ('time', 'step_times')
+    
+    __slots__ = ('_buffers', '_lengths', '_rings')
+    
+    def __init__(self):
+        self._buffers = {}
+        self._lengths = {}
+        self._rings = set()
+    
+    def reserve(self, name, rows, row_shape=(), dtype=np.float64, ring=False):
+        """
+        Make room for rows more entries of an observable.
+        
+        Parameters:
+            name: Observable name
+            rows: Number of entries about to be appended, or the number of
+                  trailing entries kept if ring is set
+            row_shape, dtype: Shape and dtype of one entry (used when the
+                              observable has no buffer yet)
+            ring: Keep only the last rows entries, overwriting older ones
+        """
+        buffer = self._buffers.get(name)
+        if ring:
+            if buffer is not None and name not in self._rings:
+                raise ValueError(f"'{name}' is already recorded in full")
+            if buffer is None:
+                self._buffers[name] = np.empty((rows,) + tuple(row_shape), dtype=dtype)
+                self._lengths[name] = 0
+                self._rings.add(name)
+            elif buffer.shape[0] != rows:
+                kept = self[name][-rows:]
+                self._buffers[name] = np.empty((rows,) + buffer.shape[1:], dtype=buffer.dtype)
+                self._buffers[name][:len(kept)] = kept
+                self._lengths[name] = len(kept)
+            return
+        if name in self._rings:
+            raise ValueError(f"'{name}' is recorded in a ring buffer")
+        if buffer is None:
+            self._buffers[name] = np.empty((rows,) + tuple(row_shape), dtype=dtype)
+            self._lengths[name] = 0
+            return
+        length = self._lengths[name]
+        if buffer.shape[0] < length + rows:
+            grown = np.empty((length + rows,) + buffer.shape[1:], dtype=buffer.dtype)
+            grown[:length] = buffer[:length]
+            self._buffers[name] = grown
+    
+    def append(self, name, value):
+        """Store value as the next entry of name, growing the buffer when it is full."""
+        value = np.asarray(value)
+        if name not in self._buffers:
+            self.reserve(name, 1, value.shape, value.dtype)
+        length = self._lengths[name]
+        if name in self._rings:
+            buffer = self._buffers[name]
+            buffer[length % buffer.shape[0]] = value
+            self._lengths[name] = length + 1
+            return
+        if length == self._buffers[name].shape[0]:
+            # Unplanned entries (e.g. adaptive step times) grow geometrically
+            self.reserve(name, length)
+        self._buffers[name][length] = value
+        self._lengths[name] = length + 1
+    
+    def __getitem__(self, name):
+        if name not in self._buffers:
+            raise KeyError(name)
+        buffer, length = self._buffers[name], self._lengths[name]
+        if name in self._rings and length > buffer.shape[0]:
+            start = length % buffer.shape[0]
+            return np.concatenate((buffer[start:], buffer[:start]))
+        return buffer[:length]
+    
+    def __contains__(self, name):
+        return name in self._buffers
+    
+    def __iter__(self):
+        return iter(self._buffers)
+    
+    def __len__(self):
+        return len(self._buffers)
+    
+    def keys(self):
+        return list(self._buffers)
+    
+    def items(self):
+        return [(name, self[name]) for name in self._buffers]
+    
+    def get(self, name, default=None):
+        return self[name] if name in self._buffers else default
+    
+    @classmethod
+    def from_arrays(cls, arrays):
+        """History whose observables are the given arrays (e.g. read-only memory maps)."""
+        history = cls()
+        history.__setstate__(arrays)
+        return history
+    
+    def __getstate__(self):
+        # Pickle only the filled rows
+        return {name: self[name].copy() for name in self._buffers}
+    
+    def __setstate__(self, state):
+        self._buffers = dict(state)
+        self._lengths = {name: len(values) for name, values in state.items()}
+        self._rings = set()
+    
+    def __repr__(self):
+        fields = ', '.join(f"{name}{self[name].shape}" for name in self._buffers)
+        return f"History({fields})"
+
+
+def _history_field(name):
+    """Read-only attribute for one observable of History."""
+    return property(lambda self: self[name], doc=f"Recorded '{name}' entries")
+
+
+for _field in History.FIELDS:
+    setattr(History, _field, _history_field(_field))
+del _field
+
 
 class QuaternionFieldSimulator:
     """Quaternion field simulator for REN-01 neurodegenerative dynamics."""
     
-    def __init__(self, Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0):
+    INTEGRATORS = ('euler', 'spectral', 'etdrk4')
+    CHI_GRADIENTS = ('central', 'laplacian')
+    BACKENDS = ('numpy', 'numba')
+    
+    def __init__(self, Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0, inplace=False,
+                 integrator='euler', backend='numpy', dtype=np.float64,
+                 homogeneous=None, n_threads=1, chi_gradient='central'):
         """
         Initialize simulator.
         
@@ -34,25 +454,97 @@ class QuaternionFieldSimulator:
             dx: Grid spacing
             dt: Time step
             T: Total simulation time
+            inplace: Step through preallocated ping-pong buffers so that no
+                     arrays are allocated per step after the first one
+            integrator: 'euler' (semi-implicit Euler, explicit diffusion) or
+                        'spectral' (diffusion and gamma_0 dissipation solved
+                        implicitly in Fourier space, no diffusive dt limit)
+                        or 'etdrk4' (fourth-order exponential time differencing
+                        Runge-Kutta with the same exact linear part)
+            backend: 'numpy', or 'numba' to run Euler steps in one fused
+                     parallel JIT kernel (falls back to 'numpy' with a
+                     warning when Numba is not installed)
+            dtype: Floating-point type of the field and of all field
+                   snapshots; np.float32 halves memory traffic and history
+                   size, while compute_chi() and q_norms still accumulate
+                   in float64 (see README for the accuracy comparison)
+            homogeneous: Integrate a spatially uniform field as the single
+                         4-component ODE it reduces to (the Laplacian and
+                         gradients vanish). None detects uniform initial
+                         states automatically in run(); True assumes the
+                         field is uniform and follows its first cell;
+                         False always integrates the full grid
+            n_threads: Split Euler steps into this many row tiles advanced
+                       concurrently on a thread pool (NumPy releases the GIL
+                       inside its kernels); worthwhile from about 128^2
+                       cells. Results are bit-identical to n_threads=1
+            chi_gradient: Gradient energy in the chi denominator: 'central'
+                          (np.gradient, the manuscript definition) or
+                          'laplacian' (periodic forward differences obtained
+                          from the Laplacian by summation by parts, which the
+                          save point shares with the next step; cheaper, but
+                          weights grid-scale noise more, so chi is lower)
         """
+        if integrator not in self.INTEGRATORS:
+            raise ValueError(f"Unknown integrator '{integrator}', "
+                             f"expected one of {self.INTEGRATORS}")
+        if inplace and integrator != 'euler':
+            raise ValueError("In-place stepping is only available for the 'euler' integrator")
+        if chi_gradient not in self.CHI_GRADIENTS:
+            raise ValueError(f"Unknown chi_gradient '{chi_gradient}', "
+                             f"expected one of {self.CHI_GRADIENTS}")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+        if backend == 'numba' and integrator != 'euler':
+            raise ValueError("The numba backend is only available for the 'euler' integrator")
+        if n_threads > 1 and (integrator != 'euler' or backend != 'numpy' or inplace):
+            raise ValueError("Threaded stepping is only available for the 'euler' "
+                             "integrator with the numpy backend")
+        if backend == 'numba' and numba is None:
+            warnings.warn("Numba is not installed; falling back to the numpy backend")
+            backend = 'numpy'
+        
         self.Lx, self.Ly = Lx, Ly
         self.dx, self.dt, self.T = dx, dt, T
         self.Nx, self.Ny = int(Lx/dx), int(Ly/dx)
         self.Nt = int(T/dt)
+        self.inplace = inplace
+        self.integrator = integrator
+        self.backend = backend
+        self.dtype = np.dtype(dtype)
+        self.homogeneous = homogeneous
+        self.n_threads = int(n_threads)
+        self.chi_gradient = chi_gradient
         
         # Quaternion field: Q = q0 + q1*i + q2*j + q3*k
-        self.Q = np.zeros((4, self.Nx, self.Ny))
-        
-        # History storage
-        self.history = {
-            'Q': [],
-            'phi_E': [],
-            'psi_D': [],
-            'A': [],
-            'chi': [],
-            'q_norms': [],
-            'time': []
-        }
+        self.Q = np.zeros((4, self.Nx, self.Ny), dtype=self.dtype)
+        
+        # Work buffers for in-place stepping and the fused Laplacian
+        # (allocated on first step)
+        self._work = None
+        self._stencil = None
+        self._spectral = None
+        self._numba_buffer = None
+        self._threaded = None
+        
+        # Save-point intermediates handed to the next step: (Q, observables)
+        self._step_cache = None
+        
+        # Time at which run(stop_when_steady=True) stopped (None: ran to T)
+        self.stop_time = None
+        
+        # Scenario and seed of the last initialize() (stored with snapshots)
+        self.scenario = None
+        self.seed = None
+        
+        # History storage (run() preallocates each recorded observable)
+        self.record = ()
+        self.history = History()
+        self._store = None
+        self._last_row = None
+        
+        # (path, checkpoint_every, config) while run() writes checkpoints
+        self._checkpoint = None
     
     def set_parameters(self, D_Q, alpha_D, alpha_A, beta_E, 
                        gamma_0, gamma_1, gamma_2, gamma_3):
@@ -65,6 +557,7 @@ class QuaternionFieldSimulator:
         self.gamma_1 = gamma_1
         self.gamma_2 = gamma_2
         self.gamma_3 = gamma_3
+        self._step_cache = None
     
     def initialize(self, scenario='healthy', seed=42):
         """
@@ -74,28 +567,9 @@ class QuaternionFieldSimulator:
             scenario: 'healthy', 'degenerative', or 'ren01'
             seed: Random seed for reproducibility
         """
-        np.random.seed(seed)
-        
-        if scenario == 'healthy':
-            # Healthy: high q0 (dopamine), low imaginary components (low entropy)
-            self.Q[0] = 0.8 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            self.Q[1] = 0.1 + 0.05 * np.random.randn(self.Nx, self.Ny)
-            self.Q[2] = 0.5 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            self.Q[3] = 0.1 + 0.05 * np.random.randn(self.Nx, self.Ny)
-            
-        elif scenario == 'degenerative':
-            # Degenerative: low q0 (dopamine), high imaginary (high entropy)
-            self.Q[0] = 0.2 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            self.Q[1] = 0.8 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            self.Q[2] = 0.2 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            self.Q[3] = 0.3 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            
-        elif scenario == 'ren01':
-            # REN-01: same initial as degenerative (different forcing drives recovery)
-            self.Q[0] = 0.2 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            self.Q[1] = 0.8 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            self.Q[2] = 0.2 + 0.1 * np.random.randn(self.Nx, self.Ny)
-            self.Q[3] = 0.3 + 0.1 * np.random.randn(self.Nx, self.Ny)
+        scenario_initial_field(self.Q, scenario, seed)
+        self.scenario, self.seed = scenario, seed
+        self._step_cache = None
     
     def compute_phi_E(self):
         """Compute local entropy density: phi_E = q1^2 + q2^2 + q3^2"""
@@ -109,43 +583,114 @@ class QuaternionFieldSimulator:
         """Compute astrocytic projection: A = q2^2"""
         return self.Q[2]**2
     
-    def compute_chi(self):
+    def compute_chi(self, observables=None):
         """
         Compute generator-consistent collapse metric.
         
         chi(t) = (alpha_D*||q0||^2 + alpha_A*||q2||^2 + beta_E*integral(phi_E)) / 
                  (integral(||nabla Q||^2) + gamma_0)
+        
+        Parameters:
+            observables: Save-point quantities of the current state from
+                         _observables() (computed if omitted)
         """
-        phi_E = self.compute_phi_E()
+        if observables is None:
+            observables = self._observables(laplacian=self.chi_gradient == 'laplacian')
+        sums = observables['sums']
         
         # Numerator: stabilizing forces + entropy term
-        q0_norm_sq = np.sum(self.Q[0]**2) * self.dx**2
-        q2_norm_sq = np.sum(self.Q[2]**2) * self.dx**2
-        phi_E_integral = np.sum(phi_E) * self.dx**2
+        q0_norm_sq = sums[0] * self.cell_area
+        q2_norm_sq = sums[2] * self.cell_area
+        phi_E_integral = observables['phi_E_sum'] * self.cell_area
         
         numerator = (self.alpha_D * q0_norm_sq + 
                      self.alpha_A * q2_norm_sq + 
                      self.beta_E * phi_E_integral)
         
-        # Denominator: spatial gradients + regularization
-        grad_Q_sq = 0
-        for i in range(4):
-            grad_x = np.gradient(self.Q[i], axis=0) / self.dx
-            grad_y = np.gradient(self.Q[i], axis=1) / self.dx
-            grad_Q_sq += np.sum(grad_x**2 + grad_y**2) * self.dx**2
+        # Denominator: spatial gradients + regularization (a reduced
+        # homogeneous state has no gradients)
+        if self.Q.shape[-2:] == (1, 1):
+            grad_Q_sq = 0
+        elif self.chi_gradient == 'laplacian':
+            # Summation by parts on the periodic grid:
+            # sum |D+ Q|^2 = -sum Q * lap(Q), with D+ the forward differences
+            # the 5-point stencil is built from (float32 fields still
+            # accumulate in float64)
+            lap = observables['lap']
+            if self.Q.dtype == np.float64:
+                dot = np.vdot(self.Q, lap)
+            else:
+                dot = np.sum(self.Q * lap, dtype=np.float64)
+            grad_Q_sq = -float(dot) * self.dx**2
+        else:
+            grad_Q_sq = 0
+            for i in range(4):
+                grad_x = np.gradient(self.Q[i], axis=0) / self.dx
+                grad_y = np.gradient(self.Q[i], axis=1) / self.dx
+                grad_Q_sq += np.sum(grad_x**2 + grad_y**2, dtype=np.float64) * self.dx**2
         
         denominator = grad_Q_sq + self.gamma_0
         
         return numerator / denominator if denominator > 0 else 0.0
     
+    def _observables(self, laplacian=False, sums=True):
+        """
+        Quantities of the current state shared by one save point.
+        
+        The squared components, phi_E and their float64 sums serve the
+        recorded fields, chi and q_norms alike, so each is computed once.
+        
+        Parameters:
+            laplacian: Also evaluate the Laplacian of Q (for the 'laplacian'
+                       gradient energy and for reuse by the next step)
+            sums: Also reduce the squares and phi_E (for chi and q_norms)
+        """
+        squares = [self.Q[i]**2 for i in range(4)]
+        phi_E = squares[1] + squares[2] + squares[3]
+        observables = {
+            'squares': squares,
+            'phi_E': phi_E
+        }
+        if sums:
+            observables['sums'] = [np.sum(square, dtype=np.float64) for square in squares]
+            observables['phi_E_sum'] = np.sum(phi_E, dtype=np.float64)
+        if laplacian:
+            observables['lap'] = self.laplacian_all(self.Q)
+        return observables
+    
+    def _step_reuses_observables(self, adaptive=False):
+        """
+        Whether the next step() consumes phi_E and the Laplacian of a save point.
+        
+        Parameters:
+            adaptive: The save point belongs to an adaptive run, which never
+                      calls step()
+        """
+        return (not adaptive and self.backend == 'numpy' and self.integrator == 'euler'
+                and self.n_threads == 1 and self.Q.shape[-2:] != (1, 1))
+    
+    def _take_step_cache(self):
+        """Pop the save-point observables if they belong to the current field."""
+        cache, self._step_cache = self._step_cache, None
+        if cache is None or cache[0] is not self.Q:
+            return {}
+        return cache[1]
+    
     def laplacian(self, field):
-        """Compute Laplacian with periodic boundary conditions."""
+        """Compute Laplacian of one component with periodic boundary conditions."""
         lap = np.zeros_like(field)
         lap += np.roll(field, 1, axis=0) + np.roll(field, -1, axis=0)
         lap += np.roll(field, 1, axis=1) + np.roll(field, -1, axis=1)
         lap -= 4 * field
         return lap / (self.dx**2)
     
+    def laplacian_all(self, Q, out=None):
+        """Compute the periodic Laplacian of all four components in one fused pass."""
+        stencil = self._stencil
+        if stencil is None or stencil.shape != Q.shape or stencil.padded.dtype != Q.dtype:
+            stencil = self._stencil = PeriodicLaplacian(Q.shape, self.dx, dtype=Q.dtype)
+        return stencil(Q, out=out)
+    
     def dissipation(self, Q):
         """
         Compute dissipation operator.
@@ -179,87 +724,847 @@ class QuaternionFieldSimulator:
         
         return Gamma
     
-    def nonlinear_forcing(self, Q):
+    def nonlinear_forcing(self, Q, phi_E=None):
         """
         Compute nonlinear forcing term.
         N(Q) = alpha_D*i*Q + alpha_A*j*Q - beta_E*phi_E*i*Q
         """
+        return quaternion_forcing(Q, self.alpha_D, self.alpha_A, self.beta_E, phi_E)
+    
+    def step(self):
+        """Perform one time step with the configured integrator."""
+        if self.backend == 'numba':
+            self._advance_numba(1)
+            return
+        if self.integrator == 'spectral':
+            self._step_spectral()
+            return
+        if self.integrator == 'etdrk4':
+            self._step_etdrk4()
+            return
+        if self.n_threads > 1:
+            self._step_threaded()
+            return
+        if self.inplace:
+            self._step_inplace()
+            return
+        
+        # phi_E and the Laplacian may already have been evaluated at a save point
+        cached = self._take_step_cache()
+        
+        # Explicit nonlinear forcing
+        N = self.nonlinear_forcing(self.Q, cached.get('phi_E'))
+        
+        # RHS = Q^n + dt*N
+        rhs = self.Q + self.dt * N
+        
+        # Laplacian term (all components at once)
+        lap = cached['lap'] if 'lap' in cached else self.laplacian_all(self.Q)
+        
+        # Q^{n+1} = (rhs + dt*D_Q*lap) / (1 + dt*gamma_effective)
+        gamma_eff = self.gamma_0
+        self.Q = (rhs + self.dt * self.D_Q * lap) / (1 + self.dt * gamma_eff)
+    
+    def advance(self, n_steps):
+        """Advance the field by n_steps time steps."""
+        if n_steps > 0 and not self._step_reuses_observables():
+            self._step_cache = None
+        if self.backend == 'numba':
+            self._advance_numba(n_steps)
+            return
+        if (self.Q.shape[-2:] == (1, 1) and self.integrator == 'euler'
+                and self.Q.dtype == np.float64):
+            self._advance_homogeneous(n_steps)
+            return
+        for _ in range(n_steps):
+            self.step()
+    
+    def _advance_homogeneous(self, n_steps):
+        """
+        Euler steps of a reduced homogeneous state as a scalar 4-variable ODE.
+        
+        For a uniform field the Laplacian vanishes and every cell follows
+        dq/dt = N(q) - gamma_0*q; Python floats evaluate it with the same
+        float64 operations as the field path, without per-step array overhead.
+        """
+        q0, q1, q2, q3 = (float(value) for value in self.Q[:, 0, 0])
+        dt, alpha_D, alpha_A, beta_E = self.dt, self.alpha_D, self.alpha_A, self.beta_E
+        decay = 1 + self.dt * self.gamma_0
+        
+        for _ in range(n_steps):
+            bphi = beta_E * (q1*q1 + q2*q2 + q3*q3)
+            n0 = ((0.0 - alpha_D*q1) - alpha_A*q2) + bphi*q1
+            n1 = ((0.0 + alpha_D*q0) + alpha_A*q3) - bphi*q0
+            n2 = ((0.0 - alpha_D*q3) + alpha_A*q0) + bphi*q3
+            n3 = ((0.0 + alpha_D*q2) - alpha_A*q1) - bphi*q2
+            q0 = (q0 + dt*n0) / decay
+            q1 = (q1 + dt*n1) / decay
+            q2 = (q2 + dt*n2) / decay
+            q3 = (q3 + dt*n3) / decay
+        
+        self.Q[:, 0, 0] = (q0, q1, q2, q3)
+    
+    def _advance_numba(self, n_steps):
+        """Run n_steps Euler steps in a single call of the fused Numba kernel."""
+        if n_steps <= 0:
+            return
+        self.Q = np.ascontiguousarray(self.Q, dtype=self.dtype)
+        buffer = self._numba_buffer
+        if buffer is None or buffer.shape != self.Q.shape:
+            buffer = self._numba_buffer = np.empty_like(self.Q)
+        
+        _euler_kernel(self.Q, buffer, n_steps, self.dt, self.dx**2,
+                      self.dt * self.D_Q, 1 + self.dt * self.gamma_0,
+                      self.alpha_D, self.alpha_A, self.beta_E)
+        if n_steps % 2 == 1:
+            self.Q, self._numba_buffer = buffer, self.Q
+    
+    def _allocate_work_buffers(self):
+        """Allocate the ping-pong field and scratch buffers used by in-place stepping."""
+        field_shape = self.Q.shape[1:]
+        self._work = {
+            'Q_next': np.empty_like(self.Q),
+            'N': np.empty_like(self.Q),
+            'lap': np.empty_like(self.Q),
+            'phi_E': np.empty(field_shape, dtype=self.Q.dtype),
+            'bphi': np.empty(field_shape, dtype=self.Q.dtype),
+            'tmp': np.empty(field_shape, dtype=self.Q.dtype)
+        }
+    
+    def _nonlinear_forcing_inplace(self, Q, N, phi_E=None):
+        """Nonlinear forcing written into N; same arithmetic as nonlinear_forcing()."""
+        w = self._work
+        bphi, tmp = w['bphi'], w['tmp']
         q0, q1, q2, q3 = Q[0], Q[1], Q[2], Q[3]
-        phi_E = q1**2 + q2**2 + q3**2
         
-        N = np.zeros_like(Q)
+        if phi_E is None:
+            phi_E = w['phi_E']
+            np.multiply(q1, q1, out=phi_E)
+            np.multiply(q2, q2, out=tmp)
+            np.add(phi_E, tmp, out=phi_E)
+            np.multiply(q3, q3, out=tmp)
+            np.add(phi_E, tmp, out=phi_E)
+        np.multiply(phi_E, self.beta_E, out=bphi)
+        
+        # (component of N, coefficient, source field, sign) in the order of nonlinear_forcing()
+        terms = (
+            # alpha_D * i*Q
+            (0, self.alpha_D, q1, -1), (1, self.alpha_D, q0, +1),
+            (2, self.alpha_D, q3, -1), (3, self.alpha_D, q2, +1),
+            # alpha_A * j*Q
+            (0, self.alpha_A, q2, -1), (1, self.alpha_A, q3, +1),
+            (2, self.alpha_A, q0, +1), (3, self.alpha_A, q1, -1),
+            # -beta_E * phi_E * i*Q
+            (0, bphi, q1, +1), (1, bphi, q0, -1),
+            (2, bphi, q3, +1), (3, bphi, q2, -1),
+        )
         
-        # alpha_D * i*Q = alpha_D * (-q1 + q0*i - q3*j + q2*k)
-        N[0] -= self.alpha_D * q1
-        N[1] += self.alpha_D * q0
-        N[2] -= self.alpha_D * q3
-        N[3] += self.alpha_D * q2
+        N.fill(0)
+        for i, coeff, q, sign in terms:
+            np.multiply(coeff, q, out=tmp)
+            if sign > 0:
+                np.add(N[i], tmp, out=N[i])
+            else:
+                np.subtract(N[i], tmp, out=N[i])
+    
+    def _step_inplace(self):
+        """Semi-implicit Euler step through preallocated buffers (no per-step allocation)."""
+        if self._work is None or self._work['Q_next'].shape != self.Q.shape:
+            self._allocate_work_buffers()
+        w = self._work
+        Q, Q_next, N, lap = self.Q, w['Q_next'], w['N'], w['lap']
         
-        # alpha_A * j*Q = alpha_A * (-q2 + q3*i + q0*j - q1*k)
-        N[0] -= self.alpha_A * q2
-        N[1] += self.alpha_A * q3
-        N[2] += self.alpha_A * q0
-        N[3] -= self.alpha_A * q1
+        cached = self._take_step_cache()
+        self._nonlinear_forcing_inplace(Q, N, cached.get('phi_E'))
+        if 'lap' in cached:
+            np.copyto(lap, cached['lap'])
+        else:
+            self.laplacian_all(Q, out=lap)
         
-        # -beta_E * phi_E * i*Q
-        N[0] += self.beta_E * phi_E * q1
-        N[1] -= self.beta_E * phi_E * q0
-        N[2] += self.beta_E * phi_E * q3
-        N[3] -= self.beta_E * phi_E * q2
+        # Q^{n+1} = (Q^n + dt*N + dt*D_Q*lap) / (1 + dt*gamma_0)
+        np.multiply(N, self.dt, out=N)
+        np.add(Q, N, out=Q_next)
+        np.multiply(lap, self.dt * self.D_Q, out=lap)
+        np.add(Q_next, lap, out=Q_next)
+        np.divide(Q_next, 1 + self.dt * self.gamma_0, out=Q_next)
         
-        return N
+        # Swap ping-pong buffers
+        self.Q, w['Q_next'] = Q_next, Q
     
-    def step(self):
-        """Perform one semi-implicit Euler step."""
-        # Explicit nonlinear forcing
+    def _step_threaded(self):
+        """
+        Semi-implicit Euler step with row tiles advanced on a thread pool.
+        
+        Each tile reads its rows and one halo row on either side of the
+        current field and writes only its own rows of the next field, so the
+        tiles need no synchronization beyond the end of the step.
+        """
+        shape = self.Q.shape
+        if self._threaded is None or self._threaded['Q_next'].shape != shape \
+                or self._threaded['Q_next'].dtype != self.Q.dtype \
+                or self._threaded['n_threads'] != self.n_threads:
+            self.close()
+            tiles = strip_bounds(shape[1], min(self.n_threads, shape[1]))
+            self._threaded = {
+                'n_threads': self.n_threads,
+                'executor': ThreadPoolExecutor(max_workers=len(tiles)),
+                'tiles': tiles,
+                'stencils': [PeriodicLaplacian((4, stop - start, shape[2]), self.dx,
+                                               dtype=self.Q.dtype)
+                             for start, stop in tiles],
+                'Q_next': np.empty_like(self.Q)
+            }
+        t = self._threaded
+        Q, Q_next = self.Q, t['Q_next']
+        
+        futures = [t['executor'].submit(strip_step, Q, Q_next, rows, stencil, self.dt,
+                                        self.D_Q, self.alpha_D, self.alpha_A,
+                                        self.beta_E, self.gamma_0)
+                   for rows, stencil in zip(t['tiles'], t['stencils'])]
+        for future in futures:
+            future.result()
+        
+        # Swap ping-pong buffers
+        self.Q, t['Q_next'] = Q_next, Q
+    
+    def close(self):
+        """
+        Shut down the thread pool of threaded stepping.
+        
+        The simulator stays usable; a later threaded step starts a new pool.
+        Simulators also work as context managers that close on exit.
+        """
+        if self._threaded is not None:
+            self._threaded['executor'].shutdown()
+            self._threaded = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _spectral_denominator(self):
+        """Implicit factor 1 + dt*(gamma_0 + D_Q*k^2), rebuilt when dt or parameters change."""
+        key = (self.Q.shape[-2:], self.Q.dtype, self.dx, self.dt, self.D_Q, self.gamma_0)
+        if self._spectral is None or self._spectral[0] != key:
+            symbol = laplacian_symbol(*self.Q.shape[-2:], self.dx)
+            denominator = 1 + self.dt * (self.gamma_0 - self.D_Q * symbol)
+            self._spectral = (key, denominator.astype(self.Q.dtype))
+        return self._spectral[1]
+    
+    def _step_spectral(self):
+        """
+        Semi-implicit spectral step for the periodic domain.
+        
+        The nonlinear forcing is explicit, while diffusion and gamma_0
+        dissipation are implicit and diagonal in Fourier space:
+            Q_hat^{n+1} = FFT(Q^n + dt*N(Q^n)) / (1 + dt*(gamma_0 + D_Q*k^2))
+        """
         N = self.nonlinear_forcing(self.Q)
+        rhs_hat = np.fft.rfft2(self.Q + self.dt * N, axes=(-2, -1))
+        rhs_hat /= self._spectral_denominator()
+        self.Q = np.fft.irfft2(rhs_hat, s=self.Q.shape[-2:], axes=(-2, -1))
+    
+    def _step_etdrk4(self):
+        """
+        Fourth-order exponential time differencing Runge-Kutta step (Cox & Matthews).
         
-        # Semi-implicit update
-        Q_new = np.zeros_like(self.Q)
+        The linear part D_Q*nabla^2 Q - gamma_0*Q is integrated exactly in
+        Fourier space; the nonlinear forcing enters through four stages.
+        """
+        shape = self.Q.shape[-2:]
+        E, E2, Qc, f1, f2, f3 = etdrk4_coefficients(
+            *shape, self.dx, self.dt, self.D_Q, self.gamma_0, dtype=self.Q.dtype)
         
-        for i in range(4):
-            # RHS = Q^n + dt*N
-            rhs = self.Q[i] + self.dt * N[i]
-            
-            # Laplacian term
-            lap = self.laplacian(self.Q[i])
-            
-            # Q^{n+1} = (rhs + dt*D_Q*lap) / (1 + dt*gamma_effective)
-            gamma_eff = self.gamma_0
-            Q_new[i] = (rhs + self.dt * self.D_Q * lap) / (1 + self.dt * gamma_eff)
+        def forcing_hat(field_hat):
+            field = np.fft.irfft2(field_hat, s=shape, axes=(-2, -1))
+            return np.fft.rfft2(self.nonlinear_forcing(field), axes=(-2, -1))
         
-        self.Q = Q_new
+        v_hat = np.fft.rfft2(self.Q, axes=(-2, -1))
+        Nv = np.fft.rfft2(self.nonlinear_forcing(self.Q), axes=(-2, -1))
+        
+        a_hat = E2 * v_hat + Qc * Nv
+        Na = forcing_hat(a_hat)
+        b_hat = E2 * v_hat + Qc * Na
+        Nb = forcing_hat(b_hat)
+        c_hat = E2 * a_hat + Qc * (2 * Nb - Nv)
+        Nc = forcing_hat(c_hat)
+        
+        v_hat = E * v_hat + Nv * f1 + 2 * (Na + Nb) * f2 + Nc * f3
+        self.Q = np.fft.irfft2(v_hat, s=shape, axes=(-2, -1))
+    
+    @property
+    def cell_area(self):
+        """Integration weight of one stored cell (the whole grid for a reduced uniform state)."""
+        return self.dx**2 * (self.Nx * self.Ny) / self.Q[0].size
+    
+    def _full_grid(self, field):
+        """Read-only view of a reduced homogeneous field broadcast to the full grid."""
+        if field.shape[-2:] == (self.Nx, self.Ny):
+            return field
+        return np.broadcast_to(field, field.shape[:-2] + (self.Nx, self.Ny))
+    
+    def _reduce_homogeneous(self):
+        """
+        Collapse a uniform field to shape (4, 1, 1) if the homogeneous setting allows it.
+        
+        Returns:
+            True if the field was reduced (restore with _expand_homogeneous)
+        """
+        if self.homogeneous is False or self.Q.shape[-2:] == (1, 1):
+            return False
+        if self.homogeneous is None and not np.all(self.Q == self.Q[:, :1, :1]):
+            return False
+        self.Q = self.Q[:, :1, :1].copy()
+        return True
+    
+    def _expand_homogeneous(self):
+        """Broadcast a reduced homogeneous field back onto the full grid."""
+        self.Q = np.ascontiguousarray(self._full_grid(self.Q))
     
-    def run(self, save_interval=20, verbose=True):
+    def _record(self, t, need_chi=False, adaptive=False):
+        """
+        Append the observables selected by self.record to the history.
+        
+        Parameters:
+            t: Time of the save point
+            need_chi: Compute chi even when it is not recorded
+            adaptive: Called from an adaptive run (no step cache is kept)
+        
+        Returns:
+            chi of the current state, or None if it was neither recorded nor needed
+        """
+        need_chi = need_chi or 'chi' in self.record
+        need_sums = need_chi or 'q_norms' in self.record
+        reuse = self._step_reuses_observables(adaptive)
+        observables = None
+        if reuse or need_sums or not set(self.record) <= {'Q'}:
+            observables = self._observables(
+                laplacian=reuse or (need_chi and self.chi_gradient == 'laplacian'),
+                sums=need_sums)
+        if reuse:
+            self._step_cache = (self.Q, observables)
+        
+        chi = self.compute_chi(observables) if need_chi else None
+        values = {
+            'Q': lambda: self._full_grid(self.Q),
+            'phi_E': lambda: self._full_grid(observables['phi_E']),
+            'psi_D': lambda: self._full_grid(observables['squares'][0]),
+            'A': lambda: self._full_grid(observables['squares'][2]),
+            'chi': lambda: chi,
+            'q_norms': lambda: [np.sqrt(total * self.cell_area)
+                                for total in observables['sums']]
+        }
+        
+        self._last_row = {name: values[name]() for name in self.record}
+        self._save_row(t, self._last_row)
+        return chi
+    
+    def _save_row(self, t, row):
+        """Store one save point in the history, or in the snapshot store if one is open."""
+        if self._store is not None:
+            self._store.append('time', t)
+            for name, value in row.items():
+                self._store.append(name, value)
+        self.history.append('time', t)
+        for name, value in row.items():
+            if self._store is None or name in RECORD_PRESETS['scalars']:
+                self.history.append(name, value)
+    
+    def _reserve_history(self, n_saves, window=None, in_memory=True):
+        """
+        Preallocate the history rows of n_saves save points.
+        
+        Parameters:
+            n_saves: Number of save points
+            window: Ring-buffer length (see run())
+            in_memory: False if fields go to a snapshot store (scalars only)
+        """
+        field = (self.Nx, self.Ny)
+        row_shapes = {'Q': (4,) + field, 'phi_E': field, 'psi_D': field, 'A': field,
+                      'chi': (), 'q_norms': (4,)}
+        self.history.reserve('time', n_saves)
+        for name in self.record:
+            if not in_memory and name not in RECORD_PRESETS['scalars']:
+                continue
+            dtype = np.float64 if name in ('chi', 'q_norms') else self.dtype
+            if window is None or name == 'chi':
+                self.history.reserve(name, n_saves, row_shapes[name], dtype)
+            else:
+                self.history.reserve(name, window, row_shapes[name], dtype, ring=True)
+    
+    def run(self, save_interval=20, verbose=True, adaptive=False,
+            rtol=1e-4, atol=1e-6, dt_max=None,
+            stop_when_steady=False, tol=1e-6, chi_tol=None, record='scalars',
+            window=None, store=None, store_budget=None, checkpoint=None,
+            checkpoint_every=10, resume_from=None):
         """
         Run simulation.
         
         Parameters:
-            save_interval: Save state every N steps
+            save_interval: Save state every N steps. Fixed-step runs take
+                           save point n after n + 1 steps and label it
+                           t = n * dt, so every snapshot is one step (dt)
+                           ahead of its time label and the initial
+                           condition is never recorded. This convention
+                           is kept for reproducibility of published results
             verbose: Print progress
+            adaptive: Use embedded error control instead of Nt fixed steps
+                      (see _run_adaptive); dt is then only the initial step.
+                      Adaptive runs record the state at exactly t = n * dt,
+                      starting with the initial condition at t = 0, so
+                      compare them with fixed-step histories at a shift of
+                      one step
+            rtol, atol: Relative and absolute tolerances of adaptive mode
+            dt_max: Upper bound on the adaptive step (default: no bound)
+            stop_when_steady: Stop at the first save point where the field is
+                              stationary, i.e. ||Q^{n+1} - Q^n||_rms / dt <= tol
+                              and |chi - chi_previous_save| <= chi_tol. The
+                              remaining save points are padded with the
+                              final snapshot and self.stop_time is set
+            tol: Stationarity tolerance on the rate of change of Q
+            chi_tol: Tolerance on the change of chi between save points
+                     (default: tol)
+            record: Observables saved at each save point besides 'time':
+                    'scalars' (chi and q_norms), 'all' (also the full Q,
+                    phi_E, psi_D and A fields), or a collection of names
+                    from RECORDABLE. Field snapshots cost 4 + 3 grids per
+                    save point, so they are opt-in
+            window: Keep only the last `window` save points of the recorded
+                    observables in ring buffers, so memory is independent
+                    of T. 'time' and 'chi' are always kept in full; the
+                    windowed entries belong to history['time'][-window:]
+            store: Directory (or open SnapshotStore) to stream the recorded
+                   observables to as memory-mapped .npy files; the returned
+                   history then holds only 'time', 'chi' and 'q_norms'.
+                   Read the snapshots back with snapshot_store.SnapshotReader
+            store_budget: Bytes of RAM the chunk buffers of a store opened
+                          from a path may use (default: 256 MiB, see
+                          SnapshotStore)
+            checkpoint: File to which the run state (Q, step index, RNG
+                        state, parameters and recorder cursor) is written
+                        atomically every checkpoint_every save points and
+                        at the end of the run (fixed-step runs only). With
+                        a store only the scalar series are included, as the
+                        field rows are already on disk; recording fields in
+                        memory without a window warns, since every
+                        checkpoint then rewrites the whole history
+            checkpoint_every: Save points between checkpoints
+            resume_from: Checkpoint file of an interrupted run with the same
+                         grid, dt, integrator, save_interval, record and
+                         window settings (pass the same store, if any).
+                         Parameters, scenario, seed and RNG state are
+                         restored from it, and the run continues
+                         bit-identically to an uninterrupted one. T may
+                         exceed that of the checkpointed run, which is then
+                         extended
         
         Returns:
-            history: Dictionary of simulation history
+            history: History of the recorded observables (dictionary-style access)
         """
-        for n in range(self.Nt):
-            self.step()
+        if adaptive and stop_when_steady:
+            raise ValueError("stop_when_steady is only available for fixed-step runs")
+        if window is not None and store is not None:
+            raise ValueError("Use either a window or a snapshot store")
+        if store_budget is not None and not isinstance(store, str):
+            raise ValueError("store_budget applies to a store opened from a path")
+        if adaptive and (checkpoint is not None or resume_from is not None):
+            raise ValueError("Checkpoints are only available for fixed-step runs")
+        self.record = parse_record_spec(record)
+        fields = [name for name in self.record if name not in RECORD_PRESETS['scalars']]
+        if checkpoint is not None and store is None and window is None and fields:
+            warnings.warn(f"Checkpoints rewrite the full in-memory history of {fields} "
+                          f"every {checkpoint_every} save points; pass store= (or "
+                          f"window=) to keep checkpoint I/O independent of the run length")
+        if window is not None:
+            self.record = parse_record_spec(self.record + ('chi',))
+        if chi_tol is None:
+            chi_tol = tol
+        config = self._checkpoint_config(save_interval, window,
+                                         (tol, chi_tol) if stop_when_steady else None)
+        
+        self.stop_time = None
+        cursor = {'n_done': 0, 'n_saved': 0, 'chi': None}
+        if resume_from is not None:
+            cursor = self._restore_checkpoint(read_checkpoint(resume_from), config)
+        
+        n_saves = len(range(0, self.Nt, save_interval))
+        self._reserve_history(n_saves, window, in_memory=store is None)
+        if resume_from is not None:
+            for name, rows in cursor['history'].items():
+                for row in rows:
+                    self.history.append(name, row)
+        if isinstance(store, str):
+            store = self._create_store(store, n_saves, save_interval, cursor['n_saved'],
+                                       store_budget)
+        self._store = store
+        if checkpoint is not None:
+            self._checkpoint = (checkpoint, checkpoint_every, config)
+        self._step_cache = None
+        reduced = self._reduce_homogeneous()
+        try:
+            if adaptive:
+                return self._run_adaptive(save_interval, verbose, rtol, atol, dt_max)
+            if stop_when_steady:
+                return self._run_until_steady(save_interval, verbose, tol, chi_tol,
+                                              cursor['n_done'], cursor['n_saved'], cursor['chi'])
+            return self._run_fixed(save_interval, verbose,
+                                   cursor['n_done'], cursor['n_saved'], cursor['chi'])
+        finally:
+            if reduced:
+                self._expand_homogeneous()
+            if self._store is not None:
+                self._store.flush()
+                self._store = None
+            self._last_row = None
+            self._checkpoint = None
+            self._step_cache = None
+    
+    def _checkpoint_config(self, save_interval, window, steady):
+        """Settings a checkpoint must share with the run that resumes it."""
+        return {
+            'grid': (self.Nx, self.Ny),
+            'dx': self.dx,
+            'dt': self.dt,
+            'integrator': self.integrator,
+            'backend': self.backend,
+            'dtype': self.dtype.name,
+            'chi_gradient': self.chi_gradient,
+            'save_interval': save_interval,
+            'record': self.record,
+            'window': window,
+            'steady': steady
+        }
+    
+    def _save_checkpoint(self, n_done, chi, final=False):
+        """
+        Write the run state after n_done steps if a checkpoint is due.
+        
+        Parameters:
+            n_done: Number of time steps taken
+            chi: chi at the last save point (seeds the steady-state test)
+            final: Write regardless of checkpoint_every (end of the run)
+        """
+        if self._checkpoint is None:
+            return
+        path, every, config = self._checkpoint
+        n_saved = len(self.history['time'])
+        if not final and n_saved % every:
+            return
+        # Frames up to the cursor must be on disk before the cursor is.
+        # The store then holds the field rows, so only the scalar series
+        # go into the checkpoint and its size does not grow with the fields
+        names = list(self.history)
+        if self._store is not None:
+            self._store.flush()
+            names = [name for name in names if name in ('time',) + RECORD_PRESETS['scalars']]
+        write_checkpoint(path, {
+            'version': CHECKPOINT_VERSION,
+            'config': config,
+            'n_done': n_done,
+            'n_saved': n_saved,
+            'chi': chi,
+            'stop_time': self.stop_time,
+            'Q': np.ascontiguousarray(self._full_grid(self.Q)),
+            'parameters': {name: float(getattr(self, name)) for name in PARAMETER_NAMES},
+            'scenario': self.scenario,
+            'seed': self.seed,
+            'rng_state': np.random.get_state(),
+            'history': {name: self.history[name] for name in names}
+        })
+    
+    def _restore_checkpoint(self, state, config):
+        """
+        Restore field, parameters and RNG state from a checkpoint.
+        
+        Returns:
+            The checkpoint, whose n_done, n_saved, chi and history entries
+            are the cursor run() continues from
+        """
+        mismatched = [key for key in config if state['config'].get(key) != config[key]]
+        if mismatched:
+            raise ValueError(f"Checkpoint was written with different settings: "
+                             f"{', '.join(mismatched)}")
+        if state['n_done'] > self.Nt:
+            raise ValueError(f"Checkpoint is at step {state['n_done']}, "
+                             f"beyond this run's Nt={self.Nt}")
+        
+        self.set_parameters(**state['parameters'])
+        self.Q = np.array(state['Q'], dtype=self.dtype)
+        self.scenario, self.seed = state['scenario'], state['seed']
+        np.random.set_state(state['rng_state'])
+        self.stop_time = state['stop_time']
+        self.history = History()
+        return state
+    
+    def _create_store(self, path, n_saves, save_interval, n_written=0, memory_budget=None):
+        """Open a snapshot store for the recorded observables of this run (see SnapshotStore)."""
+        field = (self.Nx, self.Ny)
+        row_shapes = {'Q': (4,) + field, 'phi_E': field, 'psi_D': field, 'A': field,
+                      'chi': (), 'q_norms': (4,)}
+        observables = {'time': ((), np.float64)}
+        for name in self.record:
+            dtype = np.float64 if name in ('chi', 'q_norms') else self.dtype
+            observables[name] = (row_shapes[name], dtype)
+        
+        metadata = {
+            'grid': {'Lx': self.Lx, 'Ly': self.Ly, 'dx': self.dx, 'Nx': self.Nx, 'Ny': self.Ny},
+            'dt': self.dt,
+            'T': self.T,
+            'save_interval': save_interval,
+            'integrator': self.integrator,
+            'dtype': self.dtype.name,
+            'parameters': {name: float(getattr(self, name)) for name in PARAMETER_NAMES},
+            'scenario': self.scenario,
+            'seed': self.seed
+        }
+        if memory_budget is None:
+            memory_budget = MEMORY_BUDGET
+        return SnapshotStore(path, n_saves, observables, metadata,
+                             memory_budget=memory_budget, n_written=n_written)
+    
+    def _run_fixed(self, save_interval, verbose, n_done=0, n_saved=0, chi=None):
+        """
+        Fixed-step run over Nt steps of size dt.
+        
+        Parameters:
+            n_done, n_saved, chi: Steps taken, save points written and
+                                  last chi when resuming from a checkpoint
+        """
+        # Advance in blocks between save points; step n is saved after it
+        # has been taken, i.e. after n + 1 steps
+        for n in range(0, self.Nt, save_interval)[n_saved:]:
+            self.advance(n + 1 - n_done)
+            n_done = n + 1
+            
+            t = n * self.dt
+            chi = self._record(t, need_chi=verbose and n % 200 == 0)
+            
+            if verbose and n % 200 == 0:
+                print(f"Step {n}/{self.Nt}, t={t:.2f}, chi={chi:.4f}")
+            self._save_checkpoint(n_done, chi)
+        
+        self.advance(self.Nt - n_done)
+        self._save_checkpoint(self.Nt, chi, final=True)
+        
+        return self.history
+    
+    def _run_until_steady(self, save_interval, verbose, tol, chi_tol,
+                          n_done=0, n_saved=0, chi=None):
+        """
+        Fixed-step run that stops once the field is stationary (see run()).
+        
+        Parameters:
+            n_done, n_saved, chi: Steps taken, save points written and
+                                  last chi when resuming from a checkpoint
+        """
+        save_steps = range(0, self.Nt, save_interval)
+        if self.stop_time is not None:
+            # Resumed after the stop: only save points of a longer T remain,
+            # all holding the stationary state
+            remaining = save_steps[n_saved:]
+            if remaining:
+                self._record(remaining[0] * self.dt)
+                self._pad_history([m * self.dt for m in remaining[1:]])
+            self._save_checkpoint(n_done, chi, final=True)
+            return self.history
+        
+        chi_prev = chi
+        for k in range(n_saved, len(save_steps)):
+            n = save_steps[k]
+            # Keep the state one step before the save point for the rate
+            self.advance(n - n_done)
+            Q_prev = self.Q.copy()
+            self.advance(1)
+            n_done = n + 1
+            
+            t = n * self.dt
+            chi = self._record(t, need_chi=True)
+            
+            if verbose and n % 200 == 0:
+                print(f"Step {n}/{self.Nt}, t={t:.2f}, chi={chi:.4f}")
             
-            if n % save_interval == 0:
-                t = n * self.dt
-                self.history['time'].append(t)
-                self.history['Q'].append(self.Q.copy())
-                self.history['phi_E'].append(self.compute_phi_E())
-                self.history['psi_D'].append(self.compute_psi_D())
-                self.history['A'].append(self.compute_A())
-                self.history['chi'].append(self.compute_chi())
+            if chi_prev is None:
+                chi_prev = chi
+                self._save_checkpoint(n_done, chi)
+                continue
+            rate = np.sqrt(np.mean((self.Q - Q_prev)**2, dtype=np.float64)) / self.dt
+            chi_change = abs(chi - chi_prev)
+            chi_prev = chi
+            if rate <= tol and chi_change <= chi_tol:
+                self.stop_time = t
+                if verbose:
+                    print(f"Steady at t={t:.2f} (|dQ/dt|={rate:.2e}, |dchi|={chi_change:.2e}); "
+                          f"padding {len(save_steps) - k - 1} save points")
+                self._pad_history([m * self.dt for m in save_steps[k + 1:]])
+                self._save_checkpoint(n_done, chi, final=True)
+                return self.history
+            self._save_checkpoint(n_done, chi)
+        
+        self.advance(self.Nt - n_done)
+        self._save_checkpoint(self.Nt, chi_prev, final=True)
+        
+        return self.history
+    
+    def _pad_history(self, times):
+        """Repeat the last saved entry of every recorded observable at the given save times."""
+        for t in times:
+            self._save_row(t, self._last_row)
+    
+    def _run_adaptive(self, save_interval, verbose, rtol, atol, dt_max):
+        """
+        Adaptive run with an integrating-factor Bogacki-Shampine 3(2) pair.
+        
+        The linear part L = D_Q*nabla^2 - gamma_0 is absorbed exactly in
+        Fourier space (so diffusion imposes no stability limit) and the
+        nonlinear forcing is advanced with the embedded Bogacki-Shampine
+        pair, whose second-order companion estimates the local error:
+            err = ||e / (atol + rtol*max(|Q^n|, |Q^{n+1}|))||_rms <= 1
+        Rejected steps are retried with a smaller dt; accepted steps grow dt
+        as the field relaxes. Steps are shortened to land exactly on the
+        time labels of a fixed-step run (n*dt for n = 0, save_interval, ...),
+        and the accepted step end times are stored in history['step_times'].
+        Unlike a fixed-step run, whose snapshot labelled n*dt holds the
+        state after n + 1 steps, the state recorded here is the one at n*dt.
+        """
+        shape = self.Q.shape[-2:]
+        L = (self.D_Q * laplacian_symbol(*shape, self.dx) - self.gamma_0).astype(self.Q.dtype)
+        
+        def fft(field):
+            return np.fft.rfft2(field, axes=(-2, -1))
+        
+        def ifft(field_hat):
+            return np.fft.irfft2(field_hat, s=shape, axes=(-2, -1))
+        
+        save_steps = list(range(0, self.Nt, save_interval))
+        
+        t, h = 0.0, self.dt
+        u_hat = fft(self.Q)
+        k1 = fft(self.nonlinear_forcing(self.Q))
+        n_accepted = n_rejected = 0
+        
+        if save_steps:
+            self._record(0.0, adaptive=True)
+        
+        # Integrate to each remaining save time, then on to T
+        for n_save in save_steps[1:] + [None]:
+            t_end = self.T if n_save is None else n_save * self.dt
+            
+            while t < t_end:
+                h_step = min(h, t_end - t)
+                e2, e4, e1 = np.exp(h_step / 2 * L), np.exp(h_step / 4 * L), np.exp(h_step * L)
+                
+                k2 = fft(self.nonlinear_forcing(ifft(e2 * (u_hat + h_step / 2 * k1))))
+                k3 = fft(self.nonlinear_forcing(ifft(
+                    np.exp(3 * h_step / 4 * L) * u_hat + 3 * h_step / 4 * e4 * k2)))
+                u_new_hat = e1 * u_hat + h_step * (2/9 * e1 * k1 + 1/3 * e2 * k2 + 4/9 * e4 * k3)
+                Q_new = ifft(u_new_hat)
+                k4 = fft(self.nonlinear_forcing(Q_new))
                 
-                q_norms = [np.sqrt(np.sum(self.Q[i]**2) * self.dx**2) for i in range(4)]
-                self.history['q_norms'].append(q_norms)
+                err_hat = h_step * ((2/9 - 7/24) * e1 * k1 + (1/3 - 1/4) * e2 * k2 +
+                                    (4/9 - 1/3) * e4 * k3 - 1/8 * k4)
+                scale = atol + rtol * np.maximum(np.abs(self.Q), np.abs(Q_new))
+                err = np.sqrt(np.mean((ifft(err_hat) / scale)**2))
                 
-                if verbose and n % 200 == 0:
-                    print(f"Step {n}/{self.Nt}, t={t:.2f}, chi={self.history['chi'][-1]:.4f}")
+                if err <= 1.0:
+                    t = t_end if h_step == t_end - t else t + h_step
+                    self.Q, u_hat, k1 = Q_new, u_new_hat, k4
+                    self.history.append('step_times', t)
+                    n_accepted += 1
+                else:
+                    n_rejected += 1
+                
+                # Standard controller for a third-order solution
+                factor = 5.0 if err == 0 else min(5.0, max(0.2, 0.9 * err**(-1/3)))
+                if err <= 1.0 and h_step < h:
+                    # A step shortened to hit a save time says little about
+                    # the achievable step, so keep the earlier proposal
+                    factor = max(factor, h / h_step)
+                h = h_step * factor
+                if dt_max is not None:
+                    h = min(h, dt_max)
+            
+            if n_save is not None:
+                chi = self._record(t, need_chi=verbose and n_save % 200 == 0, adaptive=True)
+                if verbose and n_save % 200 == 0:
+                    print(f"Step {n_save}/{self.Nt}, t={t:.2f}, chi={chi:.4f}, "
+                          f"dt={h:.4f}, accepted={n_accepted}, rejected={n_rejected}")
         
         return self.history
+    
+
+def write_checkpoint(path, state):
+    """Pickle a checkpoint atomically (a preempted write leaves the previous one intact)."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path):
+    """Load a checkpoint written by QuaternionFieldSimulator.run(checkpoint=...)."""
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"'{path}' is not a version {CHECKPOINT_VERSION} checkpoint")
+    return state
+
+
+def parse_record_spec(record):
+    """
+    Observable names selected by a recorder spec, in RECORDABLE order.
+    
+    Parameters:
+        record: 'scalars', 'all', a single observable name, or a collection
+                of names from RECORDABLE ('time' is always recorded)
+    """
+    if isinstance(record, str):
+        if record in RECORD_PRESETS:
+            return RECORD_PRESETS[record]
+        record = (record,)
+    names = set(record) - {'time'}
+    unknown = names - set(RECORDABLE)
+    if unknown:
+        raise ValueError(f"Unknown observables {sorted(unknown)}, expected names from "
+                         f"{RECORDABLE} or one of {tuple(RECORD_PRESETS)}")
+    return tuple(name for name in RECORDABLE if name in names)
+
+
+def scenario_initial_field(Q, scenario='healthy', seed=42):
+    """
+    Fill a (4, Nx, Ny) array in place with the initial field of a scenario.
+    
+    Parameters:
+        Q: Quaternion field array to overwrite
+        scenario: 'healthy', 'degenerative', or 'ren01'
+        seed: Random seed for reproducibility
+    """
+    Nx, Ny = Q.shape[-2:]
+    np.random.seed(seed)
+    
+    if scenario == 'healthy':
+        # Healthy: high q0 (dopamine), low imaginary components (low entropy)
+        Q[0] = 0.8 + 0.1 * np.random.randn(Nx, Ny)
+        Q[1] = 0.1 + 0.05 * np.random.randn(Nx, Ny)
+        Q[2] = 0.5 + 0.1 * np.random.randn(Nx, Ny)
+        Q[3] = 0.1 + 0.05 * np.random.randn(Nx, Ny)
+        
+    elif scenario == 'degenerative':
+        # Degenerative: low q0 (dopamine), high imaginary (high entropy)
+        Q[0] = 0.2 + 0.1 * np.random.randn(Nx, Ny)
+        Q[1] = 0.8 + 0.1 * np.random.randn(Nx, Ny)
+        Q[2] = 0.2 + 0.1 * np.random.randn(Nx, Ny)
+        Q[3] = 0.3 + 0.1 * np.random.randn(Nx, Ny)
+        
+    elif scenario == 'ren01':
+        # REN-01: same initial as degenerative (different forcing drives recovery)
+        Q[0] = 0.2 + 0.1 * np.random.randn(Nx, Ny)
+        Q[1] = 0.8 + 0.1 * np.random.randn(Nx, Ny)
+        Q[2] = 0.2 + 0.1 * np.random.randn(Nx, Ny)
+        Q[3] = 0.3 + 0.1 * np.random.randn(Nx, Ny)
 
 
 def get_healthy_parameters():
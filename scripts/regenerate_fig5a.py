@@ -6,14 +6,9 @@ Regenerate R1 Attractor Topology with Custom Layout
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
-import json
 import sys
 sys.path.append('.')
-from quaternion_simulator import QuaternionFieldSimulator
-
-# Load empirical parameters
-with open('../data/empirical_parameters.json', 'r') as f:
-    emp_params = json.load(f)
+from scenario_artifacts import load_artifacts
 
 FIGURE_DIR = '../figures'
 
@@ -40,27 +35,15 @@ def generate_fig5a_custom():
     
     # Run simulations and collect data
     for scenario, label, color in zip(scenarios, labels, colors):
-        sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-        params = emp_params['simulation_parameters'][scenario]
-        sim.set_parameters(
-            D_Q=params['D_Q'],
-            alpha_D=params['alpha_D'],
-            alpha_A=params['alpha_A'],
-            beta_E=params['beta_E'],
-            gamma_0=0.01, gamma_1=0.02, gamma_2=0.02, gamma_3=0.02
-        )
-        sim.initialize(scenario, seed=42)
-        history = sim.run(save_interval=10, verbose=False)
+        artifact = load_artifacts('empirical')[scenario]
         
         # Extract trajectories
-        q1_traj = [np.mean(Q[1]) for Q in history['Q']]
-        q2_traj = [np.mean(Q[2]) for Q in history['Q']]
-        q3_traj = [np.mean(Q[3]) for Q in history['Q']]
+        trajectory = artifact.q_mean[:, 1:]
+        q1_traj, q2_traj, q3_traj = trajectory.T
         
         # Calculate statistics
-        centroid = [np.mean(q1_traj), np.mean(q2_traj), np.mean(q3_traj)]
-        distances = [np.sqrt((q1-centroid[0])**2 + (q2-centroid[1])**2 + (q3-centroid[2])**2)
-                    for q1, q2, q3 in zip(q1_traj, q2_traj, q3_traj)]
+        centroid = np.mean(trajectory, axis=0)
+        distances = np.linalg.norm(trajectory - centroid, axis=1)
         mean_dist = np.mean(distances)
         std_dist = np.std(distances)
         
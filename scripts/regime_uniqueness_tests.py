@@ -19,68 +19,137 @@ R3: Noise Robustness
 R4: Parameter Sensitivity
 R5: Initial Condition Dependence
 R6: Surrogate Data Test
+
+Each test is split into independent workloads (one simulation or batched
+ensemble each) and a report that computes the statistics, writes the
+results and draws the figure. The runner fans the workloads of all
+selected tests out to a process pool; each workload draws from its own
+seed, derived from the suite seed and the workload key, so results do not
+depend on the number of workers or on the order workloads finish in.
+
+Usage:
+    python regime_uniqueness_tests.py                run R1, R2 and R3
+    python regime_uniqueness_tests.py R3 -j 8        run R3 on 8 processes
+    python regime_uniqueness_tests.py --output-dir out --fig-dir out/figures
 """
 
+import argparse
+import functools
+import hashlib
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import json
 import matplotlib.pyplot as plt
-from scipy.stats import ttest_ind
+from scipy.optimize import brentq
+from scipy.stats import norm, ttest_ind
 from scipy.ndimage import gaussian_filter
 import pickle
 import sys
-sys.path.append('/home/ubuntu/REN-01/simulations')
 from quaternion_simulator import (
     QuaternionFieldSimulator,
+    scenario_initial_field,
     get_healthy_parameters,
     get_degenerative_parameters,
     get_ren01_parameters
 )
+from batched_simulator import BatchedQuaternionSimulator
+
+# Default seed for reproducibility
+SEED = 42
+
+# Output directories
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+OUTPUT_DIR = os.path.join(REPO_DIR, 'validation', 'output')
+FIG_DIR = os.path.join(REPO_DIR, 'validation', 'figures')
 
-# Set random seed for reproducibility
-np.random.seed(42)
+SCENARIOS = ('healthy', 'degenerative', 'ren01')
 
-# Output directory
-OUTPUT_DIR = '/home/ubuntu/REN-01/validation/output'
-FIG_DIR = '/home/ubuntu/REN-01/validation/figures'
 
-print("="*80)
-print("REN-01 REGIME UNIQUENESS TEST SUITE")
-print("="*80)
+def task_seed(seed, key):
+    """Seed of one workload, derived from the suite seed and the workload key."""
+    digest = hashlib.sha256(repr((seed, key)).encode()).digest()
+    return int.from_bytes(digest[:4], 'little')
+
+
+def run_workload(runs, key, function, args):
+    """
+    Result of a workload, computed unless the run memo already holds it.
+    
+    Parameters:
+        runs: Run memo shared by the tests of one suite run (key -> result)
+        key: Workload key, e.g. ('R1', 'healthy')
+        function, args: Workload function and its arguments
+    """
+    if key not in runs:
+        runs[key] = function(*args)
+    return runs[key]
 
 # ============================================================================
 # TEST R1: ATTRACTOR TOPOLOGY VERIFICATION
 # ============================================================================
 
-def test_r1_attractor_topology():
+def r1_q_norms(scenario, seed=SEED):
+    """
+    q_norms trajectory of the R1 run of a scenario.
+    
+    Only q_norms is recorded, so the run memo holds an (Nsave, 4) array per
+    scenario rather than a history of fields.
+    
+    Parameters:
+        scenario: 'healthy', 'degenerative', or 'ren01'
+        seed: Seed of the initial field
+    """
+    # chi is not reported by R1, so use the cheap save-point gradient energy
+    sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0,
+                                   chi_gradient='laplacian')
+    if scenario == 'healthy':
+        sim.set_parameters(**get_healthy_parameters())
+    elif scenario == 'degenerative':
+        sim.set_parameters(**get_degenerative_parameters())
+    else:  # ren01
+        sim.set_parameters(**get_ren01_parameters())
+    sim.initialize(scenario, seed=seed)
+    history = sim.run(save_interval=1, record='q_norms', verbose=False)
+    return np.array(history['q_norms'])
+
+
+def r1_workloads(seed=SEED):
+    """Workloads of R1: one trajectory per scenario, as (key, function, args)."""
+    return [(('R1', scenario), r1_q_norms, (scenario, seed)) for scenario in SCENARIOS]
+
+
+def test_r1_attractor_topology(runs=None, output_dir=OUTPUT_DIR, fig_dir=FIG_DIR, seed=SEED):
     """
     Verify that healthy, degenerative, and REN-01 regimes have distinct
     topological structures in quaternion space.
     
     Method: Compute persistent homology (Betti numbers) for trajectories
+    
+    Parameters:
+        runs: Run memo shared with the other tests of the suite (a new one
+              by default); the statistics and the figure use the same runs
+        output_dir, fig_dir: Directories of the results and the figure
+        seed: Suite seed
     """
     print("\n" + "="*80)
     print("TEST R1: ATTRACTOR TOPOLOGY VERIFICATION")
     print("="*80)
     
+    if runs is None:
+        runs = {}
+    trajectories = {key[1]: run_workload(runs, key, function, args)
+                    for key, function, args in r1_workloads(seed)}
     results = {}
     
     for scenario in ['healthy', 'degenerative', 'ren01']:
         print(f"\nAnalyzing {scenario} attractor...")
         
-        # Run simulation
-        sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-        if scenario == 'healthy':
-            sim.set_parameters(**get_healthy_parameters())
-        elif scenario == 'degenerative':
-            sim.set_parameters(**get_degenerative_parameters())
-        else:  # ren01
-            sim.set_parameters(**get_ren01_parameters())
-        sim.initialize(scenario)
-        history = sim.run(save_interval=1, verbose=False)
-        
         # Extract Q time series (spatially averaged)
-        Q_history = np.array(history['q_norms'])
-        metrics = {'chi': history['chi']}
+        Q_history = trajectories[scenario]
         
         # Extract trajectory in (q1, q2, q3) space
         q1 = Q_history[:, 1]
@@ -154,23 +223,14 @@ def test_r1_attractor_topology():
     print(f"\nTest R1 Result: {'PASS' if pass_test else 'FAIL'}")
     
     # Save results
-    with open(f'{OUTPUT_DIR}/r1_attractor_topology.json', 'w') as f:
+    with open(f'{output_dir}/r1_attractor_topology.json', 'w') as f:
         json.dump(results, f, indent=2)
     
     # Generate figure
     fig = plt.figure(figsize=(15, 5))
     
     for idx, scenario in enumerate(['healthy', 'degenerative', 'ren01']):
-        sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-        if scenario == 'healthy':
-            sim.set_parameters(**get_healthy_parameters())
-        elif scenario == 'degenerative':
-            sim.set_parameters(**get_degenerative_parameters())
-        else:  # ren01
-            sim.set_parameters(**get_ren01_parameters())
-        sim.initialize(scenario)
-        history = sim.run(save_interval=1, verbose=False)
-        Q_history = np.array(history['q_norms'])
+        Q_history = trajectories[scenario]
         
         ax = fig.add_subplot(1, 3, idx+1, projection='3d')
         ax.plot(Q_history[:, 1], Q_history[:, 2], Q_history[:, 3], 
@@ -186,7 +246,7 @@ def test_r1_attractor_topology():
         ax.legend()
     
     plt.tight_layout()
-    plt.savefig(f'{FIG_DIR}/r1_attractor_topology.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{fig_dir}/r1_attractor_topology.png', dpi=300, bbox_inches='tight')
     plt.close()
     
     return results
@@ -195,14 +255,269 @@ def test_r1_attractor_topology():
 # TEST R2: BASIN OF ATTRACTION MAPPING
 # ============================================================================
 
-def test_r2_basin_of_attraction():
+def r2_final_chi(scenario, initial_conditions):
+    """
+    Final collapse metric of a scenario from each sampled initial condition.
+    
+    Parameters:
+        scenario: 'healthy', 'degenerative', or 'ren01'
+        initial_conditions: (n_samples, 4) unit quaternions
+    """
+    # One batched run covers every sampled initial condition
+    sim = BatchedQuaternionSimulator(len(initial_conditions), Lx=50, Ly=50, dx=1.0, dt=0.02, T=20.0)
+    if scenario == 'healthy':
+        sim.set_parameters(**get_healthy_parameters())
+    elif scenario == 'degenerative':
+        sim.set_parameters(**get_degenerative_parameters())
+    else:  # ren01
+        sim.set_parameters(**get_ren01_parameters())
+    
+    # Set initial conditions (each broadcast to its member's spatial grid);
+    # uniform states are integrated as the reduced 4-component system
+    sim.set_uniform_state(np.array(initial_conditions))
+    
+    # Run short simulation
+    history = sim.run(save_interval=10, verbose=False)
+    
+    # Record final collapse metric of every member
+    return [float(chi) for chi in history['chi'][-1]]
+
+
+# Sequential R2: batch size of a look, significance level, conditional power
+# below which a comparison is abandoned as futile, and the comparisons that
+# decide the test (others are only reported)
+R2_BATCH_SIZE = 50
+R2_ALPHA = 0.01
+R2_FUTILITY_POWER = 0.10
+R2_COMPARISONS = {
+    'healthy_vs_degen': ('healthy', 'degenerative'),
+    'ren01_vs_degen': ('ren01', 'degenerative'),
+    'healthy_vs_ren01': ('healthy', 'ren01'),
+}
+R2_DECISIVE = ('healthy_vs_degen', 'ren01_vs_degen')
+
+
+def r2_initial_conditions(seed=SEED, n_samples=500):
+    """(n_samples, 4) initial conditions sampled uniformly on S³."""
+    rng = np.random.RandomState(task_seed(seed, ('R2',)))
+    initial_conditions = []
+    for i in range(n_samples):
+        # Sample uniformly on S³
+        q = rng.randn(4)
+        q = q / np.linalg.norm(q)
+        initial_conditions.append(q)
+    return np.array(initial_conditions)
+
+
+def r2_look_workloads(initial_conditions, look, batch_size=R2_BATCH_SIZE):
+    """Workloads of one look of sequential R2: the look's batch for every scenario."""
+    batch = initial_conditions[look*batch_size:(look+1)*batch_size]
+    return [(('R2', scenario, look), r2_final_chi, (scenario, batch))
+            for scenario in SCENARIOS]
+
+
+def r2_workloads(seed=SEED, n_samples=500, sequential=False, batch_size=R2_BATCH_SIZE):
+    """
+    Workloads of R2: one batched run per scenario over shared initial conditions.
+    
+    In sequential mode only the first look is known in advance; the report
+    runs the batches of later looks as long as the decision is open.
+    """
+    initial_conditions = r2_initial_conditions(seed, n_samples)
+    if sequential:
+        return r2_look_workloads(initial_conditions, 0, batch_size)
+    return [(('R2', scenario), r2_final_chi, (scenario, initial_conditions))
+            for scenario in SCENARIOS]
+
+
+def obrien_fleming_spending(fraction, alpha):
+    """
+    Two-sided alpha spent by an information fraction under the Lan-DeMets
+    O'Brien-Fleming spending function, applied to each side with level α/2:
+    2 (2 - 2 Φ(z_{α/4} / √t)).
+    """
+    return 4 * norm.sf(norm.isf(alpha / 4) / np.sqrt(fraction))
+
+
+def group_sequential_boundaries(fractions, alpha, n_grid=2001):
+    """
+    Nominal p-value boundaries of a two-sided group-sequential test.
+    
+    The boundary of look k is chosen so that the probability under H0 of
+    first crossing at look k equals the alpha spent between looks k-1 and k
+    (Lan-DeMets O'Brien-Fleming). The score statistic is a Brownian motion
+    in the information fraction; its sub-density on the continuation region
+    is carried from look to look by numerical integration.
+    
+    Parameters:
+        fractions: Increasing information fractions of the looks, the last one 1
+        alpha: Overall two-sided significance level
+        n_grid: Grid points of the continuation region
+    
+    Returns:
+        List of nominal two-sided p-value boundaries, one per look
+    """
+    boundaries = []
+    grid = density = None
+    previous_fraction, previous_spent = 0.0, 0.0
+    for fraction in fractions:
+        spent = obrien_fleming_spending(fraction, alpha)
+        increment = spent - previous_spent
+        step = np.sqrt(fraction - previous_fraction)
+        
+        if density is None:
+            c = norm.isf(increment / 2)
+        else:
+            weights = np.full(n_grid, grid[1] - grid[0])
+            weights[[0, -1]] /= 2
+            
+            def crossing(c):
+                bound = c * np.sqrt(fraction)
+                tails = norm.sf((bound - grid) / step) + norm.cdf((-bound - grid) / step)
+                return np.dot(weights * density, tails) - increment
+            
+            c = brentq(crossing, 0.0, 40.0) if increment > 0 else np.inf
+        boundaries.append(2 * norm.sf(c))
+        
+        # Sub-density of the score at this look on the continuation region
+        bound = min(c, 40.0) * np.sqrt(fraction)
+        new_grid = np.linspace(-bound, bound, n_grid)
+        if density is None:
+            density = norm.pdf(new_grid / step) / step
+        else:
+            kernel = norm.pdf((new_grid[:, None] - grid[None, :]) / step) / step
+            density = kernel @ (weights * density)
+        grid = new_grid
+        previous_fraction, previous_spent = fraction, spent
+    return boundaries
+
+
+def conditional_power(p, fraction, final_boundary):
+    """
+    Conditional power of a two-sided test under the current trend.
+    
+    The probability that the score statistic, continuing with the drift
+    estimated so far, ends beyond the final-look boundary in the observed
+    direction (stochastic curtailment).
+    
+    Parameters:
+        p: Two-sided p-value at the current look
+        fraction: Information fraction of the current look (< 1)
+        final_boundary: Nominal two-sided p-value boundary of the final look
+    """
+    b = norm.isf(p / 2) * np.sqrt(fraction)
+    drift = b / fraction
+    c = norm.isf(final_boundary / 2)
+    return float(norm.sf((c - b - drift * (1 - fraction)) / np.sqrt(1 - fraction)))
+
+
+def r2_sequential(runs, results, seed=SEED, n_samples=500, batch_size=R2_BATCH_SIZE,
+                  alpha=R2_ALPHA, futility_power=R2_FUTILITY_POWER):
+    """
+    Sample R2 in looks of batch_size initial conditions until the decision is settled.
+    
+    After every look the pairwise t-tests are compared with two boundaries:
+    
+        efficacy  the group-sequential boundary of the look; a decisive
+                  comparison below it rejects H0
+        futility  a decisive comparison that has not rejected and whose
+                  conditional power at the final look (under the current
+                  trend) is below futility_power cannot be expected to
+                  reject, so the test fails
+    
+    Sampling stops at the first look where every decisive comparison has
+    rejected (pass) or one of them is futile (fail), or after n_samples.
+    The futility boundary is non-binding: the efficacy boundaries ignore
+    it, so the type I error stays at most alpha.
+    
+    Parameters:
+        runs: Run memo shared with the other tests of the suite
+        results: Dictionary scenario -> list, extended with the final chi values
+        seed: Suite seed
+        n_samples: Maximum number of initial conditions per scenario
+        batch_size: Initial conditions per scenario and look
+        alpha: Two-sided significance level of each comparison
+        futility_power: Conditional power below which a comparison is futile
+    
+    Returns:
+        Dictionary describing the looks, the rejections, the boundary that
+        stopped sampling ('efficacy', 'futility' or 'max_samples') and the
+        samples used
+    """
+    initial_conditions = r2_initial_conditions(seed, n_samples)
+    n_looks = -(-n_samples // batch_size)
+    fractions = [min((look + 1) * batch_size, n_samples) / n_samples for look in range(n_looks)]
+    boundaries = group_sequential_boundaries(fractions, alpha)
+    
+    rejected, futile = {}, {}
+    looks = []
+    stopped_by = 'max_samples'
+    for look in range(n_looks):
+        for key, function, args in r2_look_workloads(initial_conditions, look, batch_size):
+            results[key[1]].extend(run_workload(runs, key, function, args))
+        
+        n = len(results['healthy'])
+        p_values = {name: float(ttest_ind(results[a], results[b])[1])
+                    for name, (a, b) in R2_COMPARISONS.items()}
+        power = {}
+        for name in R2_DECISIVE:
+            if name in rejected:
+                continue
+            if p_values[name] < boundaries[look]:
+                rejected[name] = n
+            elif fractions[look] < 1:
+                power[name] = conditional_power(p_values[name], fractions[look], boundaries[-1])
+                if power[name] < futility_power:
+                    futile[name] = n
+        looks.append({'n': n, 'boundary': float(boundaries[look]), 'p': p_values,
+                      'conditional_power': power})
+        print(f"  Look {look+1}/{n_looks}: n={n}, boundary p < {boundaries[look]:.2e}, "
+              + ", ".join(f"p_{name}={p_values[name]:.2e}" for name in R2_DECISIVE))
+        
+        if len(rejected) == len(R2_DECISIVE):
+            stopped_by = 'efficacy'
+            break
+        if futile:
+            stopped_by = 'futility'
+            print(f"  Futile: {', '.join(futile)} (conditional power < {futility_power})")
+            break
+    
+    return {
+        'spending': "Lan-DeMets O'Brien-Fleming",
+        'alpha': alpha,
+        'futility_power': futility_power,
+        'batch_size': batch_size,
+        'max_samples': n_samples,
+        'samples_used': n,
+        'simulations_used': n * len(SCENARIOS),
+        'looks': looks,
+        'rejected_at': rejected,
+        'futile_at': futile,
+        'stopped_by': stopped_by
+    }
+
+
+def test_r2_basin_of_attraction(runs=None, output_dir=OUTPUT_DIR, fig_dir=FIG_DIR, seed=SEED,
+                                sequential=False, batch_size=R2_BATCH_SIZE):
     """
     Map basins of attraction by sampling initial conditions in S³
+    
+    Parameters:
+        runs: Run memo shared with the other tests of the suite
+        output_dir, fig_dir: Directories of the results and the figure
+        seed: Suite seed
+        sequential: Sample in looks of batch_size initial conditions and stop
+                    as soon as a group-sequential test settles the pass/fail
+                    decision, by efficacy or futility (see r2_sequential);
+                    the default runs all 500 samples
+        batch_size: Initial conditions per scenario and look (sequential only)
     """
     print("\n" + "="*80)
     print("TEST R2: BASIN OF ATTRACTION MAPPING")
     print("="*80)
     
+    if runs is None:
+        runs = {}
     n_samples = 500  # Reduced from 1000 for speed
     results = {
         'healthy': [],
@@ -211,46 +526,22 @@ def test_r2_basin_of_attraction():
     }
     
     # Sample random initial conditions on S³
-    print(f"\nSampling {n_samples} initial conditions on S³...")
-    initial_conditions = []
-    for i in range(n_samples):
-        # Sample uniformly on S³
-        q = np.random.randn(4)
-        q = q / np.linalg.norm(q)
-        initial_conditions.append(q)
+    if sequential:
+        print(f"\nSampling up to {n_samples} initial conditions on S³ "
+              f"in looks of {batch_size}...")
+        sequential_results = r2_sequential(runs, results, seed, n_samples, batch_size)
+        print(f"  Stopped ({sequential_results['stopped_by']}) after "
+              f"{sequential_results['samples_used']} of {n_samples} samples")
+    else:
+        print(f"\nSampling {n_samples} initial conditions on S³...")
+        for key, function, args in r2_workloads(seed, n_samples):
+            results[key[1]] = run_workload(runs, key, function, args)
     
     # Test each scenario
-    for scenario in ['healthy', 'degenerative', 'ren01']:
+    for scenario in SCENARIOS:
         print(f"\nTesting {scenario} basin...")
         
-        final_chi_values = []
-        
-        for i, q_init in enumerate(initial_conditions):
-            if i % 100 == 0:
-                print(f"  Progress: {i}/{n_samples}")
-            
-            sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=20.0)
-            if scenario == 'healthy':
-                sim.set_parameters(**get_healthy_parameters())
-            elif scenario == 'degenerative':
-                sim.set_parameters(**get_degenerative_parameters())
-            else:  # ren01
-                sim.set_parameters(**get_ren01_parameters())
-            
-            # Set initial condition (broadcast to spatial grid)
-            sim.Q[0, :, :] = q_init[0]
-            sim.Q[1, :, :] = q_init[1]
-            sim.Q[2, :, :] = q_init[2]
-            sim.Q[3, :, :] = q_init[3]
-            
-            # Run short simulation
-            history = sim.run(save_interval=10, verbose=False)
-            
-            # Record final collapse metric
-            final_chi = history['chi'][-1]
-            final_chi_values.append(final_chi)
-        
-        results[scenario] = final_chi_values
+        final_chi_values = results[scenario]
         
         mean_chi = np.mean(final_chi_values)
         std_chi = np.std(final_chi_values)
@@ -270,16 +561,22 @@ def test_r2_basin_of_attraction():
     print(f"REN-01 vs Degenerative: t={t_stat_rd:.2f}, p={p_rd:.2e}")
     print(f"Healthy vs REN-01: t={t_stat_hr:.2f}, p={p_hr:.2e}")
     
-    # Pass criterion: all p < 0.01
-    pass_test = (p_hd < 0.01) and (p_rd < 0.01)
-    
     results['statistics'] = {
         'healthy_vs_degen': {'t': float(t_stat_hd), 'p': float(p_hd)},
         'ren01_vs_degen': {'t': float(t_stat_rd), 'p': float(p_rd)},
         'healthy_vs_ren01': {'t': float(t_stat_hr), 'p': float(p_hr)}
     }
+    if sequential:
+        # Pass criterion: both comparisons crossed their group-sequential boundary
+        pass_test = len(sequential_results['rejected_at']) == len(R2_DECISIVE)
+        results['sequential'] = sequential_results
+        results['criterion'] = ("Healthy vs degenerative and REN-01 vs degenerative reject "
+                                f"at alpha = {R2_ALPHA} (group-sequential)")
+    else:
+        # Pass criterion: all p < 0.01
+        pass_test = (p_hd < 0.01) and (p_rd < 0.01)
+        results['criterion'] = "All pairwise comparisons p < 0.01"
     results['pass'] = pass_test
-    results['criterion'] = "All pairwise comparisons p < 0.01"
     
     print(f"\nTest R2 Result: {'PASS' if pass_test else 'FAIL'}")
     
@@ -289,11 +586,13 @@ def test_r2_basin_of_attraction():
         'pass': bool(results['pass']),
         'criterion': results['criterion']
     }
-    with open(f'{OUTPUT_DIR}/r2_basin_of_attraction.json', 'w') as f:
+    if sequential:
+        results_json['sequential'] = results['sequential']
+    with open(f'{output_dir}/r2_basin_of_attraction.json', 'w') as f:
         json.dump(results_json, f, indent=2)
     
     # Save full data
-    with open(f'{OUTPUT_DIR}/r2_basin_data.pkl', 'wb') as f:
+    with open(f'{output_dir}/r2_basin_data.pkl', 'wb') as f:
         pickle.dump(results, f)
     
     # Generate figure
@@ -317,7 +616,7 @@ def test_r2_basin_of_attraction():
     axes[1].grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig(f'{FIG_DIR}/r2_basin_of_attraction.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{fig_dir}/r2_basin_of_attraction.png', dpi=300, bbox_inches='tight')
     plt.close()
     
     return results
@@ -326,15 +625,73 @@ def test_r2_basin_of_attraction():
 # TEST R3: NOISE ROBUSTNESS
 # ============================================================================
 
-def test_r3_noise_robustness():
+PERTURBATION_LEVELS = [0.0, 0.05, 0.10, 0.15, 0.20, 0.30]
+
+
+def r3_chi_values(scenario, pert, n_trials, seed, perturbation_seed):
+    """
+    Final collapse metric of n_trials perturbed runs of a scenario.
+    
+    Parameters:
+        scenario: 'healthy', 'degenerative', or 'ren01'
+        pert: Relative perturbation amplitude of the parameters
+        n_trials: Number of trials (batch members)
+        seed: Trial k starts from the scenario field with seed seed + k
+        perturbation_seed: Seed of the parameter perturbations
+    """
+    rng = np.random.RandomState(perturbation_seed)
+    sim = BatchedQuaternionSimulator(n_trials, Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
+    trial_params = []
+    
+    for trial in range(n_trials):
+        if scenario == 'healthy':
+            params = get_healthy_parameters()
+        elif scenario == 'degenerative':
+            params = get_degenerative_parameters()
+        else:  # ren01
+            params = get_ren01_parameters()
+        
+        # Perturb parameters randomly
+        if pert > 0:
+            for key in ['D_Q', 'lambda_E', 'lambda_D', 'lambda_A']:
+                if key in params:
+                    params[key] *= (1.0 + rng.uniform(-pert, pert))
+        
+        trial_params.append(params)
+        scenario_initial_field(sim.Q[trial], scenario, seed=seed+trial)
+    
+    # Per-member parameter vectors, one entry per trial
+    sim.set_parameters(**{key: [params[key] for params in trial_params]
+                          for key in trial_params[0]})
+    
+    history = sim.run(save_interval=10, verbose=False)
+    
+    return [float(chi) for chi in history['chi'][-1]]
+
+
+def r3_workloads(seed=SEED, n_trials=20):
+    """Workloads of R3: one batch of trials per perturbation level and scenario."""
+    return [(('R3', pert, scenario), r3_chi_values,
+             (scenario, pert, n_trials, seed, task_seed(seed, ('R3', pert, scenario))))
+            for pert in PERTURBATION_LEVELS for scenario in SCENARIOS]
+
+
+def test_r3_noise_robustness(runs=None, output_dir=OUTPUT_DIR, fig_dir=FIG_DIR, seed=SEED):
     """
     Test regime stability under parameter perturbations
+    
+    Parameters:
+        runs: Run memo shared with the other tests of the suite
+        output_dir, fig_dir: Directories of the results and the figure
+        seed: Suite seed
     """
     print("\n" + "="*80)
     print("TEST R3: PARAMETER PERTURBATION ROBUSTNESS")
     print("="*80)
     
-    perturbation_levels = [0.0, 0.05, 0.10, 0.15, 0.20, 0.30]
+    if runs is None:
+        runs = {}
+    perturbation_levels = PERTURBATION_LEVELS
     n_trials = 20  # Reduced for speed
     
     results = {
@@ -344,45 +701,23 @@ def test_r3_noise_robustness():
         'ren01': []
     }
     
-    for pert in perturbation_levels:
-        print(f"\nTesting parameter perturbation ±{pert*100:.0f}%")
+    for key, function, args in r3_workloads(seed, n_trials):
+        pert, scenario = key[1:]
+        if scenario == SCENARIOS[0]:
+            print(f"\nTesting parameter perturbation ±{pert*100:.0f}%")
         
-        for scenario in ['healthy', 'degenerative', 'ren01']:
-            chi_values = []
-            
-            for trial in range(n_trials):
-                sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
-                if scenario == 'healthy':
-                    params = get_healthy_parameters()
-                elif scenario == 'degenerative':
-                    params = get_degenerative_parameters()
-                else:  # ren01
-                    params = get_ren01_parameters()
-                
-                # Perturb parameters randomly
-                if pert > 0:
-                    for key in ['D_Q', 'lambda_E', 'lambda_D', 'lambda_A']:
-                        if key in params:
-                            params[key] *= (1.0 + np.random.uniform(-pert, pert))
-                
-                sim.set_parameters(**params)
-                sim.initialize(scenario, seed=42+trial)
-                
-                history = sim.run(save_interval=10, verbose=False)
-                
-                final_chi = history['chi'][-1]
-                chi_values.append(final_chi)
-            
-            mean_chi = np.mean(chi_values)
-            std_chi = np.std(chi_values)
-            
-            results[scenario].append({
-                'mean': float(mean_chi),
-                'std': float(std_chi),
-                'values': chi_values
-            })
-            
-            print(f"  {scenario}: χ = {mean_chi:.4f} ± {std_chi:.4f}")
+        chi_values = run_workload(runs, key, function, args)
+        
+        mean_chi = np.mean(chi_values)
+        std_chi = np.std(chi_values)
+        
+        results[scenario].append({
+            'mean': float(mean_chi),
+            'std': float(std_chi),
+            'values': chi_values
+        })
+        
+        print(f"  {scenario}: χ = {mean_chi:.4f} ± {std_chi:.4f}")
     
     # Check ordering preservation
     print("\n" + "-"*80)
@@ -410,7 +745,7 @@ def test_r3_noise_robustness():
     print(f"\nTest R3 Result: {'PASS' if pass_test else 'FAIL'}")
     
     # Save results
-    with open(f'{OUTPUT_DIR}/r3_noise_robustness.json', 'w') as f:
+    with open(f'{output_dir}/r3_noise_robustness.json', 'w') as f:
         # Remove values arrays for JSON
         results_json = results.copy()
         for scenario in ['healthy', 'degenerative', 'ren01']:
@@ -419,7 +754,7 @@ def test_r3_noise_robustness():
         json.dump(results_json, f, indent=2)
     
     # Save full data
-    with open(f'{OUTPUT_DIR}/r3_noise_data.pkl', 'wb') as f:
+    with open(f'{output_dir}/r3_noise_data.pkl', 'wb') as f:
         pickle.dump(results, f)
     
     # Generate figure
@@ -439,40 +774,179 @@ def test_r3_noise_robustness():
     ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig(f'{FIG_DIR}/r3_noise_robustness.png', dpi=300, bbox_inches='tight')
+    plt.savefig(f'{fig_dir}/r3_noise_robustness.png', dpi=300, bbox_inches='tight')
     plt.close()
     
     return results
 
 # ============================================================================
-# MAIN EXECUTION
+# SUITE RUNNER
 # ============================================================================
 
-if __name__ == '__main__':
-    print("\nStarting regime uniqueness test suite...")
-    print(f"Random seed: 42")
-    print(f"Output directory: {OUTPUT_DIR}")
-    print(f"Figure directory: {FIG_DIR}")
+# Test name -> (report function, workload factory)
+TESTS = {
+    'R1': (test_r1_attractor_topology, r1_workloads),
+    'R2': (test_r2_basin_of_attraction, r2_workloads),
+    'R3': (test_r3_noise_robustness, r3_workloads),
+}
+
+
+def _peak_rss(reset=False):
+    """
+    Peak resident set size of this process in bytes.
     
-    all_results = {}
+    On Linux the peak can be reset, so it covers only what ran since; other
+    platforms report the peak since the process started.
+    """
+    try:
+        if reset:
+            with open('/proc/self/clear_refs', 'w') as f:
+                f.write('5')
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _timed(function, args):
+    """
+    Call function(*args), measuring it.
+    
+    Returns:
+        (result, start, end, peak): result, wall-clock start and end times
+        and peak resident memory of the process while it ran, in bytes
+    """
+    _peak_rss(reset=True)
+    start = time.time()
+    result = function(*args)
+    end = time.time()
+    return result, start, end, _peak_rss()
+
+
+def run_suite(tests=tuple(TESTS), jobs=None, seed=SEED, output_dir=OUTPUT_DIR, fig_dir=FIG_DIR,
+              options=None):
+    """
+    Run selected tests, computing their workloads in a process pool.
+    
+    The workloads of all selected tests are submitted at once; each test's
+    report runs in this process as soon as its own workloads are done.
+    
+    Parameters:
+        tests: Test names from TESTS
+        jobs: Worker processes (default: os.cpu_count()); 1 runs every
+              workload in this process
+        seed: Suite seed; initial fields and per-workload seeds derive from it
+        output_dir, fig_dir: Directories of the results and the figures
+        options: Keyword options per test, passed to its workload factory
+                 and its report, e.g. {'R2': {'sequential': True}}
+    
+    Returns:
+        (all_results, timings): results per test, and per test its wall time
+        (first workload start to report end), summed workload time and
+        peak resident memory
+    """
+    unknown = set(tests) - set(TESTS)
+    if unknown:
+        raise ValueError(f"Unknown tests {sorted(unknown)}, expected names from {tuple(TESTS)}")
+    os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(fig_dir, exist_ok=True)
+    
+    options = options or {}
+    workloads = {name: TESTS[name][1](seed, **options.get(name, {})) for name in tests}
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs != 1 else None
+    if pool is not None:
+        futures = {name: [pool.submit(_timed, function, args)
+                          for key, function, args in workloads[name]]
+                   for name in tests}
+    
+    runs, all_results, timings = {}, {}, {}
+    try:
+        for name in tests:
+            measurements = []
+            try:
+                for index, (key, function, args) in enumerate(workloads[name]):
+                    if pool is None:
+                        result, *measurement = _timed(function, args)
+                    else:
+                        result, *measurement = futures[name][index].result()
+                    runs[key] = result
+                    measurements.append(measurement)
+                report = TESTS[name][0]
+                if options.get(name):
+                    report = functools.partial(report, **options[name])
+                result, *measurement = _timed(report, (runs, output_dir, fig_dir, seed))
+                measurements.append(measurement)
+            except Exception as error:
+                traceback.print_exc()
+                result = {'pass': False, 'error': f"{type(error).__name__}: {error}"}
+            all_results[name] = result
+            if measurements:
+                timings[name] = {
+                    'wall_s': max(end for _, end, _ in measurements) - min(start for start, _, _ in measurements),
+                    'compute_s': sum(end - start for start, end, _ in measurements),
+                    'peak_mb': max(peak for _, _, peak in measurements) / 1e6,
+                }
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return all_results, timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the REN-01 regime uniqueness tests.")
+    parser.add_argument('tests', nargs='*', default=list(TESTS),
+                        help=f"Tests to run (default: all of {', '.join(TESTS)})")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="Worker processes (default: number of CPUs; 1 runs in-process)")
+    parser.add_argument('--seed', type=int, default=SEED, help="Suite seed (default: 42)")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="Directory of the results")
+    parser.add_argument('--fig-dir', default=FIG_DIR, help="Directory of the figures")
+    parser.add_argument('--sequential', action='store_true',
+                        help=f"R2: sample in looks of {R2_BATCH_SIZE} initial conditions and stop "
+                             "once a group-sequential test settles pass or fail")
+    args = parser.parse_args(argv)
+    tests = [name.upper() for name in args.tests]
+    unknown = sorted(set(tests) - set(TESTS))
+    if unknown:
+        parser.error(f"unknown tests {unknown}, expected names from {tuple(TESTS)}")
+    
+    print("="*80)
+    print("REN-01 REGIME UNIQUENESS TEST SUITE")
+    print("="*80)
+    print("\nStarting regime uniqueness test suite...")
+    print(f"Tests: {', '.join(tests)}")
+    print(f"Random seed: {args.seed}")
+    print(f"Output directory: {args.output_dir}")
+    print(f"Figure directory: {args.fig_dir}")
     
     # Run tests
     print("\n" + "="*80)
     print("EXECUTING TESTS")
     print("="*80)
     
-    all_results['R1'] = test_r1_attractor_topology()
-    all_results['R2'] = test_r2_basin_of_attraction()
-    all_results['R3'] = test_r3_noise_robustness()
+    start = time.time()
+    options = {'R2': {'sequential': True}} if args.sequential else None
+    all_results, timings = run_suite(tests, args.jobs, args.seed, args.output_dir, args.fig_dir,
+                                     options)
+    elapsed = time.time() - start
     
     # Summary
     print("\n" + "="*80)
     print("TEST SUITE SUMMARY")
     print("="*80)
     
+    print(f"{'test':6s} {'result':6s} {'wall (s)':>10s} {'compute (s)':>12s} {'peak RSS (MB)':>14s}")
     for test_name, result in all_results.items():
-        status = "PASS" if result.get('pass', False) else "FAIL"
-        print(f"{test_name}: {status}")
+        status = "PASS" if result.get('pass', False) else ("ERROR" if 'error' in result else "FAIL")
+        timing = timings.get(test_name, {'wall_s': 0.0, 'compute_s': 0.0, 'peak_mb': 0.0})
+        print(f"{test_name:6s} {status:6s} {timing['wall_s']:10.1f} "
+              f"{timing['compute_s']:12.1f} {timing['peak_mb']:14.1f}")
+    print(f"Total wall time: {elapsed:.1f}s")
     
     # Overall pass/fail
     all_pass = all(r.get('pass', False) for r in all_results.values())
@@ -486,11 +960,19 @@ if __name__ == '__main__':
         'tests_run': list(all_results.keys()),
         'pass_count': sum(1 for r in all_results.values() if r.get('pass', False)),
         'total_count': len(all_results),
-        'overall_pass': all_pass
+        'overall_pass': all_pass,
+        'seed': args.seed,
+        'timings': timings,
+        'wall_s': elapsed
     }
     
-    with open(f'{OUTPUT_DIR}/test_summary.json', 'w') as f:
+    with open(f'{args.output_dir}/test_summary.json', 'w') as f:
         json.dump(summary, f, indent=2)
     
-    print(f"\nResults saved to: {OUTPUT_DIR}")
-    print(f"Figures saved to: {FIG_DIR}")
+    print(f"\nResults saved to: {args.output_dir}")
+    print(f"Figures saved to: {args.fig_dir}")
+    return 0 if all_pass else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
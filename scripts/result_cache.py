@@ -0,0 +1,395 @@
+"""
+REN-01 Simulation Result Cache
+Content-addressed on-disk cache of QuaternionFieldSimulator runs.
+
+An entry is keyed by the SHA-256 of everything that determines a run's
+output: grid, dt, T, integrator, backend, dtype, chi gradient, the
+evolution parameters, the initial condition (scenario, seed and a hash of
+the initial field itself), save_interval, the run options and the
+simulator code version (a hash of quaternion_simulator.py,
+snapshot_store.py and the NumPy version). cached_run() returns an identical earlier run from disk instead
+of simulating:
+
+    sim.set_parameters(...)
+    sim.initialize('healthy', seed=42)
+    history = cached_run(sim, save_interval=10, record={'Q'})
+
+Each entry is a snapshot store directory (see snapshot_store.py) plus the
+final field, so observables are memory-mapped rather than unpickled. On a
+miss the Q snapshots are stored along with whatever was requested, so a
+later request for any field of the same run (phi_E, psi_D and A are
+derived from Q) is a hit as well. Entries are evicted least recently used
+first once the cache exceeds its size cap.
+
+Every fixed-step entry also holds the checkpoint of its final state. A
+miss whose spec differs from a cached entry only by a longer T resumes
+from that checkpoint (see QuaternionFieldSimulator.run(resume_from=...)),
+so extending a T=40 run to T=80 costs only the extra 40 time units and
+gives bit-identical results.
+
+Command line:
+    python result_cache.py list
+    python result_cache.py invalidate KEY [KEY ...]   (key prefixes)
+    python result_cache.py invalidate --stale         (older code versions)
+    python result_cache.py clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+import quaternion_simulator
+import snapshot_store
+from quaternion_simulator import (PARAMETER_NAMES, RECORD_PRESETS, History,
+                                  parse_record_spec)
+from snapshot_store import SnapshotReader, _write_json
+
+
+DEFAULT_DIR = os.environ.get(
+    'REN01_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'simulations', 'cache'))
+DEFAULT_MAX_BYTES = 2 * 2**30
+
+RESULT_NAME = 'result.json'
+FINAL_NAME = 'final_Q.npy'
+CHECKPOINT_NAME = 'checkpoint.pkl'
+
+# Fields that can be computed from stored Q snapshots (same expressions as
+# QuaternionFieldSimulator._observables, so the values are bit-identical)
+DERIVED_FIELDS = {
+    'phi_E': lambda Q: Q[:, 1]**2 + Q[:, 2]**2 + Q[:, 3]**2,
+    'psi_D': lambda Q: Q[:, 0]**2,
+    'A': lambda Q: Q[:, 2]**2
+}
+
+# run() options that take part in the key
+RUN_OPTIONS = ('adaptive', 'rtol', 'atol', 'dt_max', 'stop_when_steady', 'tol', 'chi_tol')
+
+
+def code_version():
+    """Hash of the simulator and snapshot store sources and the NumPy version."""
+    digest = hashlib.sha256()
+    for module in (quaternion_simulator, snapshot_store):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    digest.update(np.__version__.encode())
+    return digest.hexdigest()
+
+
+def run_spec(sim, save_interval, options):
+    """
+    Everything that determines the output of sim.run() from the current state.
+    
+    Parameters:
+        sim: QuaternionFieldSimulator with parameters and initial field set
+        save_interval: Save interval of the run
+        options: Dictionary of run() options from RUN_OPTIONS
+    """
+    field = np.ascontiguousarray(sim.Q)
+    return {
+        'code': code_version(),
+        'grid': {'Lx': sim.Lx, 'Ly': sim.Ly, 'dx': sim.dx},
+        'dt': sim.dt,
+        'T': sim.T,
+        'integrator': sim.integrator,
+        'backend': sim.backend,
+        'dtype': sim.dtype.name,
+        'chi_gradient': sim.chi_gradient,
+        'parameters': {name: float(getattr(sim, name)) for name in PARAMETER_NAMES},
+        'initial': {
+            'scenario': sim.scenario,
+            'seed': sim.seed,
+            'field': hashlib.sha256(field.tobytes()).hexdigest()
+        },
+        'save_interval': save_interval,
+        'options': {name: options[name] for name in sorted(options)}
+    }
+
+
+def spec_key(spec):
+    """SHA-256 key of a run spec."""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+
+def prefix_key(spec):
+    """Key shared by all runs of a spec that differ only in T (time extensions of each other)."""
+    return spec_key({name: value for name, value in spec.items() if name != 'T'})
+
+
+def available_observables(result):
+    """Observables an entry can serve: the stored ones, plus the fields derived from Q."""
+    stored = set(result['record'])
+    return stored | (set(DERIVED_FIELDS) if 'Q' in stored else set())
+
+
+class ResultCache:
+    """Directory of cached runs, one subdirectory per key."""
+    
+    def __init__(self, path=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Parameters:
+            path: Cache directory (created if missing; REN01_CACHE_DIR
+                  overrides the default)
+            max_bytes: Size cap; least recently used entries are evicted
+                       after each store until the cache fits
+        """
+        self.path = os.path.abspath(path)
+        self.max_bytes = max_bytes
+        os.makedirs(self.path, exist_ok=True)
+    
+    def _entry(self, key):
+        return os.path.join(self.path, key)
+    
+    def _result(self, key):
+        """Contents of an entry's result.json, or None if there is no complete entry."""
+        try:
+            with open(os.path.join(self._entry(key), RESULT_NAME), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+    
+    def keys(self):
+        """Keys of all complete entries."""
+        return [name for name in sorted(os.listdir(self.path))
+                if not name.startswith('.')
+                and os.path.isfile(os.path.join(self.path, name, RESULT_NAME))]
+    
+    def entry_size(self, key):
+        """Bytes used by an entry."""
+        entry = self._entry(key)
+        return sum(os.path.getsize(os.path.join(entry, name)) for name in os.listdir(entry))
+    
+    def last_used(self, key):
+        """Time of the last store or hit of an entry."""
+        return os.path.getmtime(os.path.join(self._entry(key), RESULT_NAME))
+    
+    def load(self, sim, key, record):
+        """
+        Restore a cached run into sim if the entry holds the requested observables.
+        
+        Sets sim.Q to the final field and sim.history, sim.record and
+        sim.stop_time as run() would.
+        
+        Returns:
+            The history, or None on a miss
+        """
+        result = self._result(key)
+        if result is None:
+            return None
+        stored = set(result['record'])
+        if not set(record) <= available_observables(result):
+            return None
+        
+        entry = self._entry(key)
+        snapshots = SnapshotReader(entry)
+        arrays = {'time': snapshots['time']}
+        for name in record:
+            if name in stored:
+                arrays[name] = snapshots[name]
+            else:
+                arrays[name] = DERIVED_FIELDS[name](snapshots['Q'])
+        
+        sim.Q = np.array(np.load(os.path.join(entry, FINAL_NAME)))
+        sim.record = record
+        sim.history = History.from_arrays(arrays)
+        sim.stop_time = result['stop_time']
+        os.utime(os.path.join(entry, RESULT_NAME))
+        return sim.history
+    
+    def find_prefix(self, spec, record):
+        """
+        The longest cached run that a run of spec extends in time.
+        
+        A prefix has the same spec apart from a shorter T, can serve every
+        observable in record, and holds a final checkpoint to resume from.
+        
+        Returns:
+            Key of the prefix entry, or None
+        """
+        prefix = prefix_key(spec)
+        best_key, best_T = None, None
+        for key in self.keys():
+            result = self._result(key)
+            T = result['spec']['T']
+            if (result.get('prefix') != prefix or T >= spec['T'] or not result.get('checkpoint')
+                    or not set(record) <= available_observables(result)):
+                continue
+            if best_T is None or T > best_T:
+                best_key, best_T = key, T
+        return best_key
+    
+    def store(self, sim, key, spec, record, save_interval, options):
+        """
+        Run sim with its snapshots streamed into a new entry for key.
+        
+        If a cached run with a shorter T is a prefix of this one (see
+        find_prefix), its store is copied and the run resumes from its
+        final checkpoint, so only the extra time is simulated.
+        
+        Parameters:
+            record: Observables to store (parsed record spec)
+        """
+        previous = self._result(key)
+        if previous is not None:
+            record = parse_record_spec(tuple(record) + tuple(previous['record']))
+        prefix = self.find_prefix(spec, record)
+        if prefix is not None:
+            record = parse_record_spec(self._result(prefix)['record'])
+        # Checkpoints need a fixed-step run; only the final one is written
+        checkpoint = not options.get('adaptive', False)
+        n_saves = len(range(0, sim.Nt, save_interval))
+        
+        # Build the entry under a temporary name so readers never see a
+        # partial one
+        tmp_entry = self._entry(f'.tmp-{key}-{os.getpid()}')
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+        try:
+            if prefix is not None:
+                shutil.copytree(self._entry(prefix), tmp_entry)
+            if checkpoint:
+                options = dict(options, checkpoint=os.path.join(tmp_entry, CHECKPOINT_NAME),
+                               checkpoint_every=n_saves + 1)
+            if prefix is not None:
+                options['resume_from'] = os.path.join(self._entry(prefix), CHECKPOINT_NAME)
+            sim.run(save_interval=save_interval, verbose=False, record=record,
+                    store=tmp_entry, **options)
+            np.save(os.path.join(tmp_entry, FINAL_NAME), sim.Q)
+            _write_json(os.path.join(tmp_entry, RESULT_NAME), {
+                'spec': spec,
+                'prefix': prefix_key(spec),
+                'record': list(record),
+                'stop_time': sim.stop_time,
+                'checkpoint': checkpoint,
+                'extended_from': None if prefix is None else self._result(prefix)['spec']['T'],
+                'created': time.time()
+            })
+            shutil.rmtree(self._entry(key), ignore_errors=True)
+            os.replace(tmp_entry, self._entry(key))
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+        self.evict(keep=key)
+    
+    def evict(self, max_bytes=None, keep=None):
+        """
+        Remove least recently used entries until the cache fits max_bytes.
+        
+        Parameters:
+            max_bytes: Size cap (default: self.max_bytes)
+            keep: Key that is never evicted (the entry just stored)
+        
+        Returns:
+            Keys of the removed entries
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        keys = sorted(self.keys(), key=self.last_used)
+        sizes = {key: self.entry_size(key) for key in keys}
+        total = sum(sizes.values())
+        removed = []
+        for key in keys:
+            if total <= max_bytes:
+                break
+            if key == keep:
+                continue
+            self.invalidate(key)
+            total -= sizes[key]
+            removed.append(key)
+        return removed
+    
+    def invalidate(self, key):
+        """Remove one entry."""
+        shutil.rmtree(self._entry(key), ignore_errors=True)
+    
+    def clear(self):
+        """Remove every entry."""
+        for name in os.listdir(self.path):
+            shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
+
+
+def cached_run(sim, save_interval=20, record='scalars', cache=None, fields=True, **options):
+    """
+    sim.run() through the result cache.
+    
+    Parameters:
+        sim: QuaternionFieldSimulator with parameters and initial field set
+        save_interval, record: As for run()
+        cache: ResultCache (default: one at DEFAULT_DIR)
+        fields: On a miss also store the Q snapshots, so that later
+                requests for any field of this run hit; set False on large
+                grids to store only the requested observables
+        **options: run() options from RUN_OPTIONS (window, store and
+                   checkpoints are not cached)
+    
+    Returns:
+        history: As returned by run(), with observables memory-mapped from
+                 the cache entry (read-only)
+    """
+    unknown = set(options) - set(RUN_OPTIONS)
+    if unknown:
+        raise TypeError(f"cached_run() does not cache run() options {sorted(unknown)}")
+    if cache is None:
+        cache = ResultCache()
+    
+    record = parse_record_spec(record)
+    spec = run_spec(sim, save_interval, options)
+    key = spec_key(spec)
+    history = cache.load(sim, key, record)
+    if history is not None:
+        return history
+    
+    stored = record + RECORD_PRESETS['scalars'] + (('Q',) if fields else ())
+    cache.store(sim, key, spec, parse_record_spec(stored), save_interval, options)
+    return cache.load(sim, key, record)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the REN-01 simulation result cache.")
+    parser.add_argument('--cache-dir', default=DEFAULT_DIR, help="Cache directory")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help="List entries, most recently used first")
+    invalidate = commands.add_parser('invalidate', help="Remove entries")
+    invalidate.add_argument('keys', nargs='*', help="Key prefixes of the entries to remove")
+    invalidate.add_argument('--stale', action='store_true',
+                            help="Remove entries written by other simulator code versions")
+    commands.add_parser('clear', help="Remove every entry")
+    evict = commands.add_parser('evict', help="Evict least recently used entries")
+    evict.add_argument('--max-bytes', type=int, default=DEFAULT_MAX_BYTES,
+                       help="Size to shrink the cache to")
+    args = parser.parse_args(argv)
+    
+    cache = ResultCache(args.cache_dir)
+    if args.command == 'list':
+        total = 0
+        for key in sorted(cache.keys(), key=cache.last_used, reverse=True):
+            spec = cache._result(key)['spec']
+            size = cache.entry_size(key)
+            total += size
+            extended_from = cache._result(key).get('extended_from')
+            print(f"{key[:16]}  {size / 2**20:8.1f} MiB  "
+                  f"{spec['initial']['scenario']}/seed={spec['initial']['seed']}  "
+                  f"T={spec['T']}{'' if extended_from is None else f' (from T={extended_from})'}  "
+                  f"dt={spec['dt']}  "
+                  f"{'current' if spec['code'] == code_version() else 'stale'}")
+        print(f"{len(cache.keys())} entries, {total / 2**20:.1f} MiB in {cache.path}")
+    elif args.command == 'invalidate':
+        current = code_version()
+        removed = [key for key in cache.keys()
+                   if any(key.startswith(prefix) for prefix in args.keys)
+                   or (args.stale and cache._result(key)['spec']['code'] != current)]
+        for key in removed:
+            cache.invalidate(key)
+        print(f"Removed {len(removed)} entries")
+    elif args.command == 'clear':
+        cache.clear()
+        print(f"Cleared {cache.path}")
+    elif args.command == 'evict':
+        removed = cache.evict(args.max_bytes)
+        print(f"Evicted {len(removed)} entries")
+
+
+if __name__ == '__main__':
+    main()
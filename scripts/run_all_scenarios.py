@@ -15,8 +15,8 @@ from quaternion_simulator import (
 )
 
 
-def run_scenario(name, params, scenario_type):
-    """Run a single scenario and return history."""
+def run_scenario(name, params, scenario_type, store):
+    """Run a single scenario, streaming its snapshots to store, and return history."""
     print(f"\n{'='*50}")
     print(f"Running {name} scenario")
     print(f"{'='*50}")
@@ -24,7 +24,7 @@ def run_scenario(name, params, scenario_type):
     sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
     sim.set_parameters(**params)
     sim.initialize(scenario_type)
-    history = sim.run(save_interval=20, verbose=True)
+    history = sim.run(save_interval=20, verbose=True, record='all', store=store)
     
     print(f"\n{name} final chi: {history['chi'][-1]:.4f}")
     return history
@@ -42,24 +42,27 @@ def main():
     results['healthy'] = run_scenario(
         'Healthy', 
         get_healthy_parameters(), 
-        'healthy'
+        'healthy',
+        os.path.join(output_dir, 'healthy_snapshots')
     )
     
     # Degenerative
     results['degenerative'] = run_scenario(
         'Degenerative', 
         get_degenerative_parameters(), 
-        'degenerative'
+        'degenerative',
+        os.path.join(output_dir, 'degenerative_snapshots')
     )
     
     # REN-01
     results['ren01'] = run_scenario(
         'REN-01', 
         get_ren01_parameters(), 
-        'ren01'
+        'ren01',
+        os.path.join(output_dir, 'ren01_snapshots')
     )
     
-    # Save pickle
+    # Save pickle (scalars only; fields are in the <scenario>_snapshots stores)
     with open(os.path.join(output_dir, 'all_scenarios_results.pkl'), 'wb') as f:
         pickle.dump(results, f)
     
@@ -76,7 +79,7 @@ def main():
     # Add q norms
     for scenario in ['healthy', 'degenerative', 'ren01']:
         prefix = scenario.capitalize() if scenario != 'ren01' else 'REN01'
-        q_norms = np.array(results[scenario]['q_norms'])
+        q_norms = results[scenario]['q_norms']
         data[f'{prefix}_q0_Norm'] = q_norms[:, 0]
         data[f'{prefix}_q1_Norm'] = q_norms[:, 1]
         data[f'{prefix}_q2_Norm'] = q_norms[:, 2]
@@ -0,0 +1,166 @@
+"""
+REN-01 Scenario Artifacts
+Simulates each regime once and publishes the arrays the figures plot.
+
+An artifact holds typed arrays of one scenario run (50x50 grid, dt=0.02,
+T=40, seed 42) under one of two parameter sets:
+
+    'empirical'  parameters calibrated from data/empirical_parameters.json
+                 (figures 1-5a), saved every 10 steps
+    'reference'  get_*_parameters() of quaternion_simulator.py
+                 (generate_figures.py), saved every 20 steps
+
+Arrays (Nsave save points, N x N grid):
+    time         (Nsave,)          save times
+    chi          (Nsave,)          collapse metric
+    q_norms      (Nsave, 4)        L2 norms of q0..q3
+    q_mean       (Nsave, 4)        spatial means of q0..q3
+    q_std        (Nsave, 4)        spatial standard deviations of q0..q3
+    final_Q      (4, N, N)         field at the last save point
+    final_phi_E  (N, N)            phi_E, psi_D and A of final_Q
+    final_psi_D  (N, N)
+    final_A      (N, N)
+
+Artifacts are .npz files under simulations/artifacts/<parameter set>/.
+Each records the result-cache key of the run it was built from and is
+rebuilt when that key changes (parameters, initial condition or simulator
+code). The runs themselves go through result_cache.cached_run().
+"""
+
+import functools
+import json
+import os
+
+import numpy as np
+
+from quaternion_simulator import (QuaternionFieldSimulator, get_degenerative_parameters,
+                                  get_healthy_parameters, get_ren01_parameters)
+from result_cache import cached_run, run_spec, spec_key
+
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+DEFAULT_DIR = os.environ.get('REN01_ARTIFACT_DIR',
+                             os.path.join(REPO_DIR, 'simulations', 'artifacts'))
+
+SCENARIOS = ('healthy', 'degenerative', 'ren01')
+PARAMETER_SETS = ('empirical', 'reference')
+SAVE_INTERVALS = {'empirical': 10, 'reference': 20}
+
+ARRAY_NAMES = ('time', 'chi', 'q_norms', 'q_mean', 'q_std',
+               'final_Q', 'final_phi_E', 'final_psi_D', 'final_A')
+
+
+def scenario_parameters(parameter_set, scenario):
+    """Evolution parameters of a scenario under a parameter set."""
+    if parameter_set == 'reference':
+        return {'healthy': get_healthy_parameters,
+                'degenerative': get_degenerative_parameters,
+                'ren01': get_ren01_parameters}[scenario]()
+    if parameter_set == 'empirical':
+        with open(os.path.join(REPO_DIR, 'data', 'empirical_parameters.json'), 'r') as f:
+            params = json.load(f)['simulation_parameters'][scenario]
+        return dict(D_Q=params['D_Q'], alpha_D=params['alpha_D'],
+                    alpha_A=params['alpha_A'], beta_E=params['beta_E'],
+                    gamma_0=0.01, gamma_1=0.02, gamma_2=0.02, gamma_3=0.02)
+    raise ValueError(f"Unknown parameter set '{parameter_set}', "
+                     f"expected one of {PARAMETER_SETS}")
+
+
+def scenario_simulator(parameter_set, scenario):
+    """Simulator set up with the parameters and initial field of a scenario."""
+    sim = QuaternionFieldSimulator(Lx=50, Ly=50, dx=1.0, dt=0.02, T=40.0)
+    sim.set_parameters(**scenario_parameters(parameter_set, scenario))
+    sim.initialize(scenario, seed=42)
+    return sim
+
+
+class ScenarioArtifact:
+    """Arrays of one simulated scenario (see module docstring for shapes)."""
+    
+    __slots__ = ('parameter_set', 'scenario', 'key') + ARRAY_NAMES
+    
+    def __init__(self, parameter_set, scenario, key, **arrays):
+        self.parameter_set = parameter_set
+        self.scenario = scenario
+        self.key = key
+        for name in ARRAY_NAMES:
+            setattr(self, name, np.asarray(arrays[name]))
+    
+    @classmethod
+    def from_history(cls, parameter_set, scenario, key, history):
+        """Build an artifact from a run that recorded Q."""
+        Q = history['Q']
+        final_Q = np.array(Q[-1])
+        return cls(parameter_set, scenario, key,
+                   time=history['time'],
+                   chi=history['chi'],
+                   q_norms=history['q_norms'],
+                   q_mean=np.mean(Q, axis=(2, 3)),
+                   q_std=np.std(Q, axis=(2, 3)),
+                   final_Q=final_Q,
+                   final_phi_E=final_Q[1]**2 + final_Q[2]**2 + final_Q[3]**2,
+                   final_psi_D=final_Q[0]**2,
+                   final_A=final_Q[2]**2)
+    
+    def save(self, path):
+        """Write the artifact to an .npz file (atomically)."""
+        tmp_path = path + '.tmp.npz'
+        np.savez(tmp_path, parameter_set=self.parameter_set, scenario=self.scenario,
+                 key=self.key, **{name: getattr(self, name) for name in ARRAY_NAMES})
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path):
+        """Read an artifact written by save()."""
+        with np.load(path) as data:
+            return cls(str(data['parameter_set']), str(data['scenario']), str(data['key']),
+                       **{name: data[name] for name in ARRAY_NAMES})
+    
+    def __repr__(self):
+        return (f"ScenarioArtifact({self.parameter_set}/{self.scenario}, "
+                f"{len(self.time)} save points, grid {self.final_Q.shape[1:]})")
+
+
+def build_artifact(parameter_set, scenario, path=DEFAULT_DIR):
+    """
+    Load the artifact of a scenario, simulating it first if it is missing or stale.
+    
+    Parameters:
+        parameter_set: 'empirical' or 'reference'
+        scenario: 'healthy', 'degenerative' or 'ren01'
+        path: Artifact directory
+    """
+    sim = scenario_simulator(parameter_set, scenario)
+    save_interval = SAVE_INTERVALS[parameter_set]
+    key = spec_key(run_spec(sim, save_interval, {}))
+    
+    filename = os.path.join(path, parameter_set, f'{scenario}.npz')
+    if os.path.exists(filename):
+        artifact = ScenarioArtifact.load(filename)
+        if artifact.key == key:
+            return artifact
+    
+    history = cached_run(sim, save_interval=save_interval, record={'Q', 'chi', 'q_norms'})
+    artifact = ScenarioArtifact.from_history(parameter_set, scenario, key, history)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    artifact.save(filename)
+    return artifact
+
+
+@functools.lru_cache(maxsize=None)
+def load_artifacts(parameter_set='empirical', path=DEFAULT_DIR):
+    """
+    Artifacts of all three scenarios under one parameter set.
+    
+    Built on first use and shared by every figure function of a process.
+    
+    Returns:
+        Dictionary scenario -> ScenarioArtifact
+    """
+    return {scenario: build_artifact(parameter_set, scenario, path) for scenario in SCENARIOS}
+
+
+if __name__ == '__main__':
+    for parameter_set in PARAMETER_SETS:
+        for scenario, artifact in load_artifacts(parameter_set).items():
+            print(f"{artifact}: chi_final={artifact.chi[-1]:.4f}")
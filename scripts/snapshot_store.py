@@ -0,0 +1,221 @@
+"""
+REN-01 Snapshot Store
+Streams simulation snapshots to disk as memory-mapped .npy files.
+
+A store is a directory holding one .npy file per observable, each with one
+row per save point, plus header.json describing the run (grid, dt,
+parameters, seed, observables and how many frames have been written):
+
+    store/
+        header.json
+        time.npy     (Nsave,)
+        chi.npy      (Nsave,)
+        Q.npy        (Nsave, 4, Nx, Ny)
+        ...
+
+SnapshotStore writes frames through an in-memory chunk whose length is
+chosen from a memory budget; each full chunk is written through a memmap
+window of just those rows and released, so resident memory stays within the
+budget however long the run is. SnapshotReader maps the files read-only and
+slices them by time, so reading the last frame pages in that frame alone.
+"""
+
+import json
+import os
+
+import numpy as np
+
+
+HEADER_NAME = 'header.json'
+
+# Default RAM for the chunk buffers of a SnapshotStore, in bytes
+MEMORY_BUDGET = 256 * 2**20
+
+
+def _write_json(path, data):
+    """Write JSON atomically (readers never see a partial header)."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class SnapshotStore:
+    """Chunked writer of a snapshot store directory."""
+    
+    def __init__(self, path, n_frames, observables, metadata=None,
+                 memory_budget=MEMORY_BUDGET, n_written=0):
+        """
+        Create the store and preallocate its files.
+        
+        Parameters:
+            path: Store directory (created if missing; existing observable
+                  files are overwritten)
+            n_frames: Number of save points the run will produce
+            observables: Dictionary name -> (row_shape, dtype) of the
+                         observables stored per save point
+            metadata: JSON-serializable description of the run (grid, dt,
+                      parameters, seed, ...) stored in the header
+            memory_budget: Bytes of RAM the chunk buffers may use; the chunk
+                           length is the number of whole frames that fit
+                           (at least one)
+            n_written: Keep the first n_written frames of the existing store
+                       at path and append after them (used when a run is
+                       resumed from a checkpoint); the files are extended
+                       if n_frames exceeds their length
+        """
+        self.path = path
+        self.n_frames = int(n_frames)
+        os.makedirs(path, exist_ok=True)
+        if n_written:
+            with open(os.path.join(path, HEADER_NAME), 'r') as f:
+                written = json.load(f)['n_written']
+            if written < n_written:
+                raise ValueError(f"Store '{path}' holds {written} frames, "
+                                 f"cannot resume after frame {n_written}")
+        
+        frame_bytes = sum(int(np.prod(shape)) * np.dtype(dtype).itemsize
+                          for shape, dtype in observables.values())
+        self.chunk_frames = int(max(1, min(self.n_frames, memory_budget // max(frame_bytes, 1))))
+        
+        self._files = {}
+        self._buffers = {}
+        self._counts = {}
+        self._pending = {}
+        for name, (shape, dtype) in observables.items():
+            filename = os.path.join(path, f'{name}.npy')
+            if n_written:
+                mapped = self._reopen(filename, n_written, (self.n_frames,) + tuple(shape), dtype)
+            else:
+                # Writes the .npy header and sizes the (sparse) file
+                mapped = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype,
+                                                   shape=(self.n_frames,) + tuple(shape))
+            self._files[name] = (filename, mapped.offset, mapped.dtype, mapped.shape[1:])
+            del mapped
+            self._buffers[name] = np.empty((self.chunk_frames,) + tuple(shape), dtype=dtype)
+            self._counts[name] = n_written
+            self._pending[name] = 0
+        
+        self.header = {
+            'metadata': metadata or {},
+            'n_frames': self.n_frames,
+            'n_written': n_written,
+            'chunk_frames': self.chunk_frames,
+            'observables': {name: {'shape': list(shape), 'dtype': np.dtype(dtype).str}
+                            for name, (shape, dtype) in observables.items()}
+        }
+        _write_json(os.path.join(path, HEADER_NAME), self.header)
+    
+    def _reopen(self, filename, n_written, shape, dtype):
+        """Map an existing observable file, copying its first n_written frames into a longer file if needed."""
+        mapped = np.load(filename, mmap_mode='r+')
+        if mapped.shape[1:] != shape[1:] or mapped.dtype != np.dtype(dtype):
+            raise ValueError(f"'{filename}' holds frames of shape {mapped.shape[1:]} "
+                             f"and dtype {mapped.dtype}, expected {shape[1:]} and {np.dtype(dtype)}")
+        if mapped.shape[0] >= shape[0]:
+            return mapped
+        
+        tmp_name = filename + '.tmp.npy'
+        grown = np.lib.format.open_memmap(tmp_name, mode='w+', dtype=dtype, shape=shape)
+        for start in range(0, n_written, self.chunk_frames):
+            stop = min(start + self.chunk_frames, n_written)
+            grown[start:stop] = mapped[start:stop]
+        grown.flush()
+        del mapped, grown
+        os.replace(tmp_name, filename)
+        return np.load(filename, mmap_mode='r+')
+    
+    def append(self, name, value):
+        """Append one frame of an observable."""
+        count, pending = self._counts[name], self._pending[name]
+        if count >= self.n_frames:
+            raise IndexError(f"Store '{self.path}' holds {self.n_frames} frames of '{name}'")
+        self._buffers[name][pending] = value
+        self._counts[name] = count + 1
+        self._pending[name] = pending + 1
+        if pending + 1 == self.chunk_frames:
+            self._write_chunk(name)
+    
+    def _write_chunk(self, name):
+        """Write the buffered frames of name through a memmap window of their rows."""
+        n_buffered = self._pending[name]
+        start = self._counts[name] - n_buffered
+        filename, offset, dtype, shape = self._files[name]
+        frame_bytes = int(np.prod(shape)) * dtype.itemsize
+        window = np.memmap(filename, dtype=dtype, mode='r+',
+                           offset=offset + start * frame_bytes,
+                           shape=(n_buffered,) + shape)
+        window[:] = self._buffers[name][:n_buffered]
+        window.flush()
+        del window
+        self._pending[name] = 0
+    
+    def flush(self):
+        """Write all buffered frames and record the frame count in the header."""
+        for name, pending in self._pending.items():
+            if pending:
+                self._write_chunk(name)
+        self.header['n_written'] = min(self._counts.values(), default=0)
+        _write_json(os.path.join(self.path, HEADER_NAME), self.header)
+    
+    def close(self):
+        """Flush and release the chunk buffers."""
+        self.flush()
+        self._buffers = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SnapshotReader:
+    """Read-only, memory-mapped access to a snapshot store."""
+    
+    def __init__(self, path):
+        """
+        Parameters:
+            path: Store directory written by SnapshotStore
+        """
+        self.path = path
+        with open(os.path.join(path, HEADER_NAME), 'r') as f:
+            self.header = json.load(f)
+        self.metadata = self.header['metadata']
+        self.n_frames = self.header['n_written']
+        self.observables = tuple(self.header['observables'])
+        self.time = np.array(self._map('time')) if 'time' in self.observables else None
+    
+    def _map(self, name):
+        """Memory map of the written frames of name (nothing is read yet)."""
+        if name not in self.observables:
+            raise KeyError(f"'{name}' is not in store '{self.path}' "
+                           f"(available: {', '.join(self.observables)})")
+        return np.load(os.path.join(self.path, f'{name}.npy'), mmap_mode='r')[:self.n_frames]
+    
+    def frames(self, name, t_start=None, t_stop=None):
+        """
+        Frames of an observable with save times in [t_start, t_stop].
+        
+        Returns a read-only memmap slice; only the rows actually used are
+        read from disk.
+        """
+        frames = self._map(name)
+        if t_start is None and t_stop is None:
+            return frames
+        start = 0 if t_start is None else np.searchsorted(self.time, t_start, side='left')
+        stop = self.n_frames if t_stop is None else np.searchsorted(self.time, t_stop, side='right')
+        return frames[start:stop]
+    
+    def times(self, t_start=None, t_stop=None):
+        """Save times in [t_start, t_stop]."""
+        return np.asarray(self.frames('time', t_start, t_stop))
+    
+    def last(self, name):
+        """Last written frame of an observable, as an in-memory array."""
+        if self.n_frames == 0:
+            raise IndexError(f"Store '{self.path}' has no frames")
+        return np.array(self._map(name)[-1])
+    
+    def __getitem__(self, name):
+        return self.frames(name)
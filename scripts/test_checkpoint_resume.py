@@ -0,0 +1,118 @@
+"""
+REN-01 Checkpoint Resume Test
+Checks that a run preempted after a checkpoint and resumed from it matches
+an uninterrupted run bit for bit.
+
+The preemption is simulated by raising from the recorder partway through
+the run, after the last checkpoint and before the next one, so the resumed
+run has to redo the save points in between. A run resumed with a larger T
+into the same snapshot store must equal an uninterrupted run to that T.
+
+Run with pytest, or directly: python test_checkpoint_resume.py
+"""
+
+import os
+import tempfile
+import warnings
+
+import numpy as np
+
+from quaternion_simulator import QuaternionFieldSimulator, get_degenerative_parameters
+from snapshot_store import SnapshotReader
+
+GRID = 16
+DT = 0.02
+SAVE_INTERVAL = 5
+CHECKPOINT_EVERY = 4
+T_SHORT = 2.0     # 20 save points
+T_LONG = 3.0      # 30 save points
+PREEMPT_AT = 10   # save points written before the simulated preemption
+
+
+class Preempted(Exception):
+    pass
+
+
+def make_simulator(T):
+    sim = QuaternionFieldSimulator(Lx=GRID, Ly=GRID, dx=1.0, dt=DT, T=T)
+    sim.set_parameters(**get_degenerative_parameters())
+    sim.initialize('degenerative', seed=7)
+    return sim
+
+
+def preempt_after(sim, n_rows):
+    """Make sim raise Preempted when it is about to write save point n_rows."""
+    save_row = sim._save_row
+    
+    def interrupted(t, row):
+        if len(sim.history['time']) == n_rows:
+            raise Preempted
+        save_row(t, row)
+    sim._save_row = interrupted
+
+
+def run_quietly(sim, **options):
+    # Full-field recording without a store warns that checkpoints rewrite it
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return sim.run(save_interval=SAVE_INTERVAL, verbose=False,
+                       checkpoint_every=CHECKPOINT_EVERY, **options)
+
+
+def assert_same_history(history, reference):
+    assert sorted(history.keys()) == sorted(reference.keys())
+    for name in reference:
+        assert np.array_equal(history[name], reference[name]), name
+
+
+def test_resume_after_preemption(tmp_path):
+    reference = make_simulator(T_SHORT)
+    expected = run_quietly(reference, record='all')
+    
+    checkpoint = os.path.join(tmp_path, 'run.ckpt')
+    sim = make_simulator(T_SHORT)
+    preempt_after(sim, PREEMPT_AT)
+    try:
+        run_quietly(sim, record='all', checkpoint=checkpoint)
+    except Preempted:
+        pass
+    else:
+        raise AssertionError("the run was not preempted")
+    
+    resumed = make_simulator(T_SHORT)
+    # Draw from the RNG so only the checkpoint can restore its state
+    np.random.rand(3)
+    history = run_quietly(resumed, record='all', resume_from=checkpoint)
+    
+    assert_same_history(history, expected)
+    assert np.array_equal(resumed.Q, reference.Q)
+
+
+def test_resume_into_larger_T_with_store(tmp_path):
+    reference = make_simulator(T_LONG)
+    expected_history = run_quietly(reference, record={'Q', 'psi_D'},
+                                   store=os.path.join(tmp_path, 'reference'))
+    expected = SnapshotReader(os.path.join(tmp_path, 'reference'))
+    
+    store = os.path.join(tmp_path, 'store')
+    checkpoint = os.path.join(tmp_path, 'run.ckpt')
+    run_quietly(make_simulator(T_SHORT), record={'Q', 'psi_D'},
+                store=store, checkpoint=checkpoint)
+    
+    extended = make_simulator(T_LONG)
+    history = run_quietly(extended, record={'Q', 'psi_D'}, store=store,
+                          resume_from=checkpoint)
+    
+    assert_same_history(history, expected_history)
+    assert np.array_equal(extended.Q, reference.Q)
+    snapshots = SnapshotReader(store)
+    for name in ('time', 'Q', 'psi_D'):
+        assert np.array_equal(snapshots[name], expected[name]), name
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmp_path:
+        test_resume_after_preemption(tmp_path)
+    with tempfile.TemporaryDirectory() as tmp_path:
+        test_resume_into_larger_T_with_store(tmp_path)
+    print("PASS: resumed runs are bit-identical to uninterrupted runs")
@@ -0,0 +1,57 @@
+"""
+REN-01 In-Place Stepping Allocation Test
+Checks that step() with inplace=True allocates no arrays per step.
+
+One field-sized temporary on the 64x64 grid is 128 KiB (4 x 64 x 64
+float64), so the bounds below catch any array allocated in the step
+while leaving room for the small Python objects NumPy creates per call.
+
+Run with pytest, or directly: python test_inplace_allocation.py
+"""
+
+import tracemalloc
+
+from quaternion_simulator import QuaternionFieldSimulator, get_healthy_parameters
+
+N_WARMUP = 3
+N_STEPS = 200
+PEAK_BOUND = 16 * 1024     # bytes traced at any point during the steps
+GROWTH_BOUND = 4 * 1024    # bytes retained after N_STEPS steps
+
+
+def measure_inplace_steps(n_steps=N_STEPS):
+    """
+    Traced allocations of n_steps in-place steps after a warm-up.
+    
+    Returns:
+        (peak, growth): peak traced memory during the steps and memory
+        still held after them, in bytes (tracing starts at zero)
+    """
+    sim = QuaternionFieldSimulator(Lx=64, Ly=64, dx=1.0, dt=0.02, T=1.0, inplace=True)
+    sim.set_parameters(**get_healthy_parameters())
+    sim.initialize('healthy')
+    
+    # The first steps allocate the work buffers and the Laplacian stencil
+    for _ in range(N_WARMUP):
+        sim.step()
+    
+    tracemalloc.start()
+    try:
+        for _ in range(n_steps):
+            sim.step()
+        growth, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, growth
+
+
+def test_inplace_step_allocates_nothing():
+    peak, growth = measure_inplace_steps()
+    assert peak < PEAK_BOUND, f"in-place steps peaked at {peak} bytes"
+    assert growth < GROWTH_BOUND, f"{growth} bytes retained after {N_STEPS} in-place steps"
+
+
+if __name__ == '__main__':
+    test_inplace_step_allocates_nothing()
+    peak, growth = measure_inplace_steps()
+    print(f"PASS: peak {peak} bytes, net growth {growth} bytes over {N_STEPS} in-place steps")